@@ -2,34 +2,38 @@
 """
 GUI package for the Password Manager
 Modular components for better organization
+
+The Tkinter classes below are imported on first access, so loading the
+PySide6 modules (gui.main_app_pyside etc.) doesn't pull in tkinter.
 """
 
-from .main_app import MultiVaultPasswordManagerGUI
-from .dialogs import (
-    CreateVaultDialog,
-    AddEntryDialog,
-    EditEntryDialog,
-    GeneratePasswordDialog
-)
-from .components import (
-    SearchBox,
-    StatusBar,
-    ToolBar,
-    TreeViewManager,
-    DialogBase
-)
-from .events import EventHandler
-
-__all__ = [
-    'MultiVaultPasswordManagerGUI',
-    'CreateVaultDialog',
-    'AddEntryDialog', 
-    'EditEntryDialog',
-    'GeneratePasswordDialog',
-    'SearchBox',
-    'StatusBar',
-    'ToolBar',
-    'TreeViewManager',
-    'DialogBase',
-    'EventHandler'
-]
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'MultiVaultPasswordManagerGUI': '.main_app',
+    'CreateVaultDialog': '.dialogs',
+    'EntryDialog': '.dialogs',
+    'GeneratePasswordDialog': '.dialogs',
+    'SearchBox': '.components',
+    'StatusBar': '.components',
+    'ToolBar': '.components',
+    'TreeViewManager': '.components',
+    'DialogBase': '.components',
+    'EventHandler': '.events',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -63,18 +63,39 @@ class StatusBar:
         
         # Progress bar
         self.progress = ttk.Progressbar(self.frame, mode='indeterminate')
+        self._progress_shown = False
+        
+        # Latest message not yet shown, and the idle callback that shows it
+        self._pending_status = None
+        self._status_after_id = None
         
     def set_status(self, message):
-        """Set the status message"""
-        self.status_var.set(message)
+        """Set the status message
+        
+        The label is updated once Tk is idle, so several messages set
+        while handling one event cost a single redraw of the last one.
+        """
+        self._pending_status = message
+        if self._status_after_id is None:
+            self._status_after_id = self.frame.after_idle(self._flush_status)
+            
+    def _flush_status(self):
+        self._status_after_id = None
+        self.status_var.set(self._pending_status)
         
     def show_progress(self):
         """Show the progress bar"""
+        if self._progress_shown:
+            return
+        self._progress_shown = True
         self.progress.pack(side=tk.RIGHT, padx=5)
         self.progress.start()
         
     def hide_progress(self):
         """Hide the progress bar"""
+        if not self._progress_shown:
+            return
+        self._progress_shown = False
         self.progress.stop()
         self.progress.pack_forget()
         
@@ -136,15 +157,34 @@ class TreeViewManager:
         
     def clear(self):
         """Clear all items from the treeview"""
-        for item in self.treeview.get_children():
-            self.treeview.delete(item)
+        self.treeview.delete(*self.treeview.get_children())
             
     def add_item(self, values, tags=None):
         """Add an item to the treeview"""
-        item = self.treeview.insert("", "end", values=values)
-        if tags:
-            self.treeview.item(item, tags=tags)
-        return item
+        return self.treeview.insert("", "end", values=values, tags=tags or ())
+        
+    def replace_items(self, rows):
+        """Replace all items with rows of (values, tags) and return the new ids
+        
+        The treeview is taken off the grid while it is refilled, so Tk lays
+        it out once instead of once per inserted row.
+        """
+        tree = self.treeview
+        gridded = tree.winfo_manager() == "grid"
+        if gridded:
+            tree.grid_remove()
+        try:
+            tree.delete(*tree.get_children())
+            insert = tree.insert
+            return [insert("", "end", values=values, tags=tags or ()) for values, tags in rows]
+        finally:
+            if gridded:
+                tree.grid()
+        
+    def add_items(self, rows):
+        """Append rows of (values, tags) and return the new ids"""
+        insert = self.treeview.insert
+        return [insert("", "end", values=values, tags=tags or ()) for values, tags in rows]
         
     def get_selected_item(self):
         """Get the currently selected item"""
@@ -4,18 +4,117 @@ PySide6-based UI components for the Password Manager GUI
 Modern, responsive components with better styling
 """
 
+import functools
+import os
+import sys
+from pathlib import Path
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QPushButton, QLineEdit, QLabel, QTreeWidget, QTreeWidgetItem,
-    QScrollBar, QFrame, QGroupBox, QSplitter, QStatusBar,
-    QProgressBar, QToolBar, QMenu, QMessageBox,
-    QDialog, QFormLayout, QTextEdit, QCheckBox, QSpinBox,
-    QComboBox, QTabWidget, QTableWidget, QTableWidgetItem,
-    QHeaderView, QApplication, QMainWindow
+    QWidget, QHBoxLayout, QPushButton, QLineEdit, QLabel,
+    QStatusBar, QProgressBar, QToolBar, QDialog, QApplication, QStyle, QMessageBox
+)
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QTimer, QAbstractItemModel, QModelIndex, QSignalBlocker,
+    QSortFilterProxyModel
 )
-from PySide6.QtGui import QAction
-from PySide6.QtCore import Qt, Signal, QTimer, QThread
-from PySide6.QtGui import QFont, QIcon, QPixmap, QKeySequence
+from PySide6.QtGui import (
+    QAction, QIcon, QPixmap, QPainter, QPalette, QColor, QGuiApplication
+)
+
+# Application-wide stylesheets, applied once by load_stylesheet()
+STYLE_DIR = Path(__file__).parent
+
+# PWMGR_NO_THEME=1 skips all stylesheets and keeps the native Qt style,
+# e.g. over SSH/VNC where stylesheet polishing dominates startup
+THEME_ENABLED = os.environ.get("PWMGR_NO_THEME") != "1"
+
+# Copied passwords are wiped from the clipboard after this long
+CLIPBOARD_CLEAR_MS = 30_000
+
+
+def set_clipboard_text(text, clear_after=CLIPBOARD_CLEAR_MS):
+    """Copy text to Qt's clipboard and clear it again after clear_after ms
+    
+    The clipboard is only cleared if it still holds this text, so anything
+    the user copied in the meantime is left alone. 0 disables the clear.
+    """
+    clipboard = QGuiApplication.clipboard()
+    clipboard.setText(text)
+    if clear_after:
+        QTimer.singleShot(clear_after, lambda: _clear_clipboard(text))
+
+
+def _clear_clipboard(text):
+    clipboard = QGuiApplication.clipboard()
+    if clipboard.text() == text:
+        clipboard.clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_qss(name="style"):
+    """Read a stylesheet variant once and reuse the same string afterwards"""
+    with open(STYLE_DIR / f"{name}.qss", "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=1)
+def _dark_palette():
+    """Base colors of the dark theme; style.qss only adds what QSS must"""
+    palette = QPalette()
+    for role, color in (
+        (QPalette.Window, "#1e1e1e"),
+        (QPalette.WindowText, "white"),
+        (QPalette.Base, "#2b2b2b"),
+        (QPalette.AlternateBase, "#333333"),
+        (QPalette.Text, "white"),
+        (QPalette.PlaceholderText, "#888888"),
+        (QPalette.Button, "#2b2b2b"),
+        (QPalette.ButtonText, "white"),
+        (QPalette.Highlight, "#0078d4"),
+        (QPalette.HighlightedText, "white"),
+        (QPalette.ToolTipBase, "#2b2b2b"),
+        (QPalette.ToolTipText, "white"),
+    ):
+        palette.setColor(role, QColor(color))
+    return palette
+
+
+def load_stylesheet(app=None, name="style"):
+    """Apply the dark palette and shared QSS stylesheet to the application"""
+    if not THEME_ENABLED:
+        return
+    app = app or QApplication.instance()
+    app.setPalette(_dark_palette())
+    app.setStyleSheet(_get_qss(name))
+
+
+def _as_slot(callback):
+    """Mark a plain function as a Qt slot before it is connected.
+
+    Bound methods are returned unchanged: their class should declare them
+    with @Slot() so the slot is part of the QObject's static metaobject.
+    """
+    func = getattr(callback, "__func__", callback)
+    if hasattr(func, "_slots") or func is not callback:
+        return callback
+    try:
+        return Slot()(callback)
+    except (AttributeError, TypeError, SystemError):
+        # Builtins, partials and other callables can't carry the marker
+        return callback
+
+
+@functools.lru_cache(maxsize=128)
+def _icon(name):
+    """Load an icon once by theme name or file path and share it app-wide"""
+    if QIcon.hasThemeIcon(name):
+        return QIcon.fromTheme(name)
+    return QIcon(name)
+
+
+def _resolve_icon(icon):
+    """Accept either a QIcon or a theme name / path string"""
+    return _icon(icon) if isinstance(icon, str) else icon
 
 
 class ModernButton(QPushButton):
@@ -25,31 +124,30 @@ class ModernButton(QPushButton):
         super().__init__(text, parent)
         self.setup_style()
         if icon:
-            self.setIcon(icon)
+            self.setIcon(_resolve_icon(icon))
     
     def setup_style(self):
         """Apply modern styling"""
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #2b2b2b;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3b3b3b;
-                border: 1px solid #666666;
-            }
-            QPushButton:pressed {
-                background-color: #1b1b1b;
-            }
-            QPushButton:disabled {
-                background-color: #1a1a1a;
-                color: #666666;
-            }
-        """)
+        self.setProperty("class", "modern")
+
+
+@functools.lru_cache(maxsize=None)
+def _search_icon_pixmap(device_pixel_ratio=1.0, size=16):
+    """Render the magnifier glyph once per pixel ratio and reuse the pixmap
+
+    Built lazily because a QPixmap can only exist once a QApplication does.
+    """
+    side = round(size * device_pixel_ratio)
+    pixmap = QPixmap(side, side)
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    font = painter.font()
+    font.setPixelSize(size - 2)
+    painter.setFont(font)
+    painter.drawText(0, 0, size, size, Qt.AlignCenter, "🔍")
+    painter.end()
+    return pixmap
 
 
 class SearchBox(QWidget):
@@ -57,6 +155,10 @@ class SearchBox(QWidget):
     
     textChanged = Signal(str)
     
+    # Delay before re-emitting textChanged, so a burst of keystrokes
+    # results in a single downstream filter pass
+    DEBOUNCE_MS = 150
+    
     def __init__(self, parent=None, placeholder="Search entries..."):
         super().__init__(parent)
         self.setup_ui(placeholder)
@@ -67,30 +169,29 @@ class SearchBox(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         
         # Search icon label
-        self.icon_label = QLabel("🔍")
-        self.icon_label.setStyleSheet("color: #888888; font-size: 14px;")
+        self.icon_label = QLabel()
+        self.icon_label.setObjectName("searchIcon")
+        self.icon_label.setPixmap(_search_icon_pixmap(self.devicePixelRatioF()))
         layout.addWidget(self.icon_label)
         
         # Search input
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText(placeholder)
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 8px 12px;
-                background-color: #2b2b2b;
-                color: white;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #0078d4;
-            }
-        """)
+        self.search_input.setProperty("class", "search")
         layout.addWidget(self.search_input)
         
+        # Debounce timer
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self._emit_text_changed)
+        
         # Connect signals
-        self.search_input.textChanged.connect(self.textChanged)
+        self.search_input.textChanged.connect(self._timer.start)
+    
+    def _emit_text_changed(self):
+        """Emit the search text once typing has paused"""
+        self.textChanged.emit(self.search_input.text())
     
     def get_text(self):
         """Get the current search text"""
@@ -110,30 +211,11 @@ class StatusBar(QStatusBar):
     
     def setup_ui(self):
         """Setup the status bar UI"""
-        self.setStyleSheet("""
-            QStatusBar {
-                background-color: #1e1e1e;
-                color: white;
-                border-top: 1px solid #555555;
-            }
-        """)
-        
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #555555;
-                border-radius: 2px;
-                text-align: center;
-                background-color: #2b2b2b;
-            }
-            QProgressBar::chunk {
-                background-color: #0078d4;
-                border-radius: 1px;
-            }
-        """)
         self.addPermanentWidget(self.progress_bar)
+        self._progress_visible = False
         
         # Set initial status
         self.showMessage("Ready")
@@ -143,12 +225,18 @@ class StatusBar(QStatusBar):
         self.showMessage(message)
     
     def show_progress(self):
-        """Show the progress bar"""
+        """Show the progress bar (no-op if it is already showing)"""
+        if self._progress_visible:
+            return
+        self._progress_visible = True
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
     
     def hide_progress(self):
-        """Hide the progress bar"""
+        """Hide the progress bar (no-op if it is already hidden)"""
+        if not self._progress_visible:
+            return
+        self._progress_visible = False
         self.progress_bar.setVisible(False)
 
 
@@ -157,45 +245,35 @@ class ToolBar(QToolBar):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setup_ui()
         self.actions = {}
     
-    def setup_ui(self):
-        """Setup the toolbar UI"""
-        self.setStyleSheet("""
-            QToolBar {
-                background-color: #2b2b2b;
-                border: none;
-                spacing: 4px;
-                padding: 4px;
-            }
-            QToolButton {
-                background-color: transparent;
-                border: 1px solid transparent;
-                border-radius: 4px;
-                padding: 6px 12px;
-                color: white;
-                font-weight: bold;
-            }
-            QToolButton:hover {
-                background-color: #3b3b3b;
-                border: 1px solid #555555;
-            }
-            QToolButton:pressed {
-                background-color: #1b1b1b;
-            }
-        """)
-    
     def add_button(self, text, callback, icon=None, tooltip=None):
-        """Add a button to the toolbar"""
+        """Add a button to the toolbar
+        
+        icon may be a QIcon or a theme name / file path, which is loaded
+        once and shared between buttons.
+        
+        Callbacks should be decorated with @Slot() to avoid the runtime
+        cost of registering them with the QMetaObject on connect.
+
+        Re-adding the same text/callback pair returns the existing action
+        instead of allocating and connecting a duplicate.
+        """
+        # Bound methods are recreated on every attribute access, so key them
+        # by their instance and function rather than by the method object
+        target = getattr(callback, "__func__", callback)
+        key = (text, id(getattr(callback, "__self__", None)), id(target))
+        if key in self.actions:
+            return self.actions[key]
+        
         action = QAction(text, self)
         if icon:
-            action.setIcon(icon)
+            action.setIcon(_resolve_icon(icon))
         if tooltip:
             action.setToolTip(tooltip)
-        action.triggered.connect(callback)
+        action.triggered.connect(_as_slot(callback))
         self.addAction(action)
-        self.actions[text] = action
+        self.actions[key] = action
         return action
     
     def add_separator(self):
@@ -203,79 +281,318 @@ class ToolBar(QToolBar):
         self.addSeparator()
 
 
+class EntryModel(QAbstractItemModel):
+    """Flat item model holding the rows shown in a tree view"""
+    
+    def __init__(self, headers=None, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers or [])
+        # Each row is [values, tags, background]
+        self._rows = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Number of top-level rows (rows have no children)"""
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Number of columns, taken from the headers"""
+        return len(self._headers)
+    
+    def index(self, row, column, parent=QModelIndex()):
+        """Create an index for a top-level row"""
+        if parent.isValid() or not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column)
+    
+    def parent(self, index=QModelIndex()):
+        """Rows are flat, so every index is top-level"""
+        return QModelIndex()
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return row data for the requested role"""
+        if not index.isValid():
+            return None
+        values, tags, background = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return values[column] if column < len(values) else ""
+        if role == Qt.UserRole and column == 0:
+            return tags
+        if role == Qt.BackgroundRole and column == 0:
+            return background
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return the column titles"""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            if section < len(self._headers):
+                return self._headers[section]
+        return None
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort rows by a column, keeping selections on the same rows"""
+        self.layoutAboutToBeChanged.emit()
+        old_rows = list(self._rows)
+        self._rows.sort(
+            key=lambda row: str(row[0][column]) if column < len(row[0]) else "",
+            reverse=(order == Qt.DescendingOrder)
+        )
+        new_positions = {id(row): i for i, row in enumerate(self._rows)}
+        old_indexes = self.persistentIndexList()
+        new_indexes = [
+            self.index(new_positions[id(old_rows[idx.row()])], idx.column())
+            for idx in old_indexes
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+    
+    def append(self, values, tags=None):
+        """Append a row and return its row number"""
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append([[str(v) for v in values], tags, None])
+        self.endInsertRows()
+        return row
+    
+    def extend(self, rows, tags=None):
+        """Append many rows with a single insert notification
+
+        tags, if given, holds one tag per row. Returns the row number of
+        the first appended row.
+        """
+        first = len(self._rows)
+        new_rows = self._make_rows(rows, tags)
+        if new_rows:
+            self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+            self._rows.extend(new_rows)
+            self.endInsertRows()
+        return first
+    
+    def clear(self):
+        """Remove all rows"""
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
+    
+    def set_rows(self, rows, tags=None):
+        """Replace all rows with a single reset notification
+        
+        tags, if given, holds one tag per row.
+        """
+        self.beginResetModel()
+        self._rows = self._make_rows(rows, tags)
+        self.endResetModel()
+    
+    @staticmethod
+    def _make_rows(rows, tags):
+        """Build stored rows from display values and optional tags"""
+        if tags is None:
+            return [[[str(v) for v in values], None, None] for values in rows]
+        return [[[str(v) for v in values], tag, None] for values, tag in zip(rows, tags)]
+    
+    def row_values(self, row):
+        """Get the display values of a row"""
+        return list(self._rows[row][0])
+    
+    def set_row_values(self, row, values):
+        """Replace the display values of one row"""
+        self._rows[row][0] = [str(v) for v in values]
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, self.columnCount() - 1), [Qt.DisplayRole]
+        )
+    
+    def remove(self, row):
+        """Remove one row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+    
+    def find_tag(self, tag):
+        """Row number of the first row with this tag, or None"""
+        for row, (values, row_tag, background) in enumerate(self._rows):
+            if row_tag == tag:
+                return row
+        return None
+    
+    def set_background(self, row, brush):
+        """Set the background of the first cell of a row"""
+        self._rows[row][2] = brush
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.BackgroundRole])
+    
+    def row_tag(self, row):
+        """Get the tag a row was added with"""
+        return self._rows[row][1]
+
+
+class EntryFilterProxy(QSortFilterProxyModel):
+    """Proxy that hides EntryModel rows without removing them
+    
+    Rows are shown when the filter, called with the row's tag, returns
+    True. Sorting is passed through to the source model.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._accept = None
+    
+    def set_filter(self, accept):
+        """Set the tag predicate, or None to show every row"""
+        self._accept = accept
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        """Ask the filter about the row's tag"""
+        if self._accept is None:
+            return True
+        return self._accept(self.sourceModel().row_tag(source_row))
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort the source rows; the proxy keeps their order"""
+        self.sourceModel().sort(column, order)
+
+
 class TreeViewManager:
-    """Manager for tree view widgets with modern styling"""
-    
-    def __init__(self, tree_widget):
-        self.tree = tree_widget
-        self.setup_styling()
-    
-    def setup_styling(self):
-        """Apply modern styling to the tree widget"""
-        self.tree.setStyleSheet("""
-            QTreeWidget {
-                background-color: #2b2b2b;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                color: white;
-                font-size: 13px;
-                gridline-color: #444444;
-            }
-            QTreeWidget::item {
-                padding: 4px;
-                border: none;
-            }
-            QTreeWidget::item:selected {
-                background-color: #0078d4;
-            }
-            QTreeWidget::item:hover {
-                background-color: #3b3b3b;
-            }
-            QHeaderView::section {
-                background-color: #1e1e1e;
-                color: white;
-                padding: 8px;
-                border: none;
-                border-right: 1px solid #555555;
-                border-bottom: 1px solid #555555;
-                font-weight: bold;
-            }
-            QHeaderView::section:hover {
-                background-color: #2b2b2b;
-            }
-        """)
+    """Manager for model-backed tree views with modern styling"""
+    
+    def __init__(self, tree_view, headers=None):
+        self.tree = tree_view
+        self.model = EntryModel(headers, tree_view)
+        self._proxy = EntryFilterProxy(tree_view)
+        self._proxy.setSourceModel(self.model)
+        self.tree.setModel(self._proxy)
+        self.setup_view()
+    
+    def setup_view(self):
+        """Configure the view for fast painting of large lists"""
+        self.tree.setRootIsDecorated(False)
+        # Every row has the same height, so Qt can skip per-row sizeHint
+        # calls and lay out only the visible rows
+        self.tree.setUniformRowHeights(True)
     
     def clear(self):
         """Clear all items from the tree"""
-        self.tree.clear()
+        self.model.clear()
     
     def add_item(self, values, tags=None):
-        """Add an item to the tree"""
-        item = QTreeWidgetItem(values)
-        if tags:
-            item.setData(0, Qt.UserRole, tags)
-        self.tree.addTopLevelItem(item)
-        return item
+        """Add an item to the tree and return its row"""
+        return self.model.append(values, tags)
+    
+    def add_items(self, rows):
+        """Add many items at once and return the row of the first one
+        
+        Prefer this over calling add_item in a loop: the view gets one
+        rowsInserted notification for the whole batch instead of one per row.
+        """
+        return self.model.extend(rows)
+    
+    def bulk_update(self, rows, tags=None):
+        """Replace all items in one pass and return the row of the first one
+        
+        The model swaps its rows inside one reset, so the view gets a single
+        notification, and painting is suspended meanwhile. A sortable view
+        has sorting switched off meanwhile and sorts the new rows once when
+        it is switched back on.
+        """
+        sorting = self.tree.isSortingEnabled()
+        self.tree.setUpdatesEnabled(False)
+        self.tree.setSortingEnabled(False)
+        try:
+            self.model.set_rows(rows, tags)
+            return 0
+        finally:
+            self.tree.setSortingEnabled(sorting)
+            self.tree.setUpdatesEnabled(True)
+    
+    def update_item(self, row, values):
+        """Change the values of one item in place"""
+        self.model.set_row_values(row, values)
+    
+    def remove_item(self, row):
+        """Remove one item"""
+        self.model.remove(row)
+    
+    def find_item(self, tag):
+        """Get the row of the item added with this tag, or None"""
+        return self.model.find_tag(tag)
+    
+    def set_filter(self, accept):
+        """Show only the items whose tag accept(tag) is true
+        
+        Hidden items stay in the model, so changing or clearing the filter
+        (accept=None) doesn't re-add any rows. Item rows passed to and
+        returned by this manager are model rows, hidden or not.
+        """
+        self._proxy.set_filter(accept)
+    
+    def visible_count(self):
+        """Number of items the filter lets through"""
+        return self._proxy.rowCount()
     
     def get_selected_item(self):
-        """Get the currently selected item"""
-        items = self.tree.selectedItems()
-        return items[0] if items else None
+        """Get the row of the current selection, or None"""
+        rows = self.tree.selectionModel().selectedRows()
+        return self._proxy.mapToSource(rows[0]).row() if rows else None
     
     def get_selected_values(self):
         """Get values from the selected item"""
-        item = self.get_selected_item()
-        if item:
-            return [item.text(i) for i in range(item.columnCount())]
+        row = self.get_selected_item()
+        if row is not None:
+            return self.model.row_values(row)
         return None
     
-    def select_item(self, item):
-        """Select a specific item"""
-        self.tree.setCurrentItem(item)
+    def select_item(self, row):
+        """Select a specific row"""
+        self.tree.setCurrentIndex(self._proxy.mapFromSource(self.model.index(row, 0)))
+    
+    def set_item_background(self, row, brush):
+        """Highlight a row"""
+        self.model.set_background(row, brush)
     
-    def refresh(self):
-        """Refresh the tree view"""
-        self.tree.viewport().update()
+    def expand_all(self):
+        """Expand every node in one pass
+        
+        Use this instead of looping setExpanded(True) per row, which
+        repaints the tree once per call.
+        """
+        with QSignalBlocker(self.tree):
+            self.tree.setUpdatesEnabled(False)
+            self.tree.expandAll()
+            self.tree.setUpdatesEnabled(True)
+    
+    def collapse_all(self):
+        """Collapse every node in one pass"""
+        with QSignalBlocker(self.tree):
+            self.tree.setUpdatesEnabled(False)
+            self.tree.collapseAll()
+            self.tree.setUpdatesEnabled(True)
+    
+    def refresh(self, first_row=None, last_row=None):
+        """Refresh the tree view
+        
+        With a row range only those rows are repainted; without one the
+        whole viewport is.
+        """
+        if first_row is None:
+            self.tree.viewport().update()
+            return
+        if last_row is None:
+            last_row = first_row
+        self.model.dataChanged.emit(
+            self.model.index(first_row, 0),
+            self.model.index(last_row, self.model.columnCount() - 1),
+            [Qt.DisplayRole]
+        )
+
+
+# X11/Wayland and macOS window managers place modal dialogs themselves;
+# only Windows gets explicit centering
+_WM_PLACES_DIALOGS = sys.platform != "win32"
+
+# Dialogs reused across opens, keyed by (dialog class, id(parent))
+_dialog_pool = {}
 
 
 class DialogBase(QDialog):
@@ -283,6 +600,8 @@ class DialogBase(QDialog):
     
     def __init__(self, parent=None, title="Dialog", width=400, height=300):
         super().__init__(parent)
+        self._centered = False
+        self._warn_box = None
         self.setup_ui(title, width, height)
     
     def setup_ui(self, title, width, height):
@@ -291,56 +610,57 @@ class DialogBase(QDialog):
         self.setFixedSize(width, height)
         self.setModal(True)
         
-        # Apply modern styling
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: white;
-            }
-            QLabel {
-                color: white;
-                font-size: 13px;
-            }
-            QLineEdit, QTextEdit, QSpinBox, QComboBox {
-                background-color: #1e1e1e;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 6px;
-                color: white;
-                font-size: 13px;
-            }
-            QLineEdit:focus, QTextEdit:focus {
-                border: 2px solid #0078d4;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton:disabled {
-                background-color: #555555;
-                color: #888888;
-            }
-        """)
+        # Styled by the QDialog#modal rules in style.qss; set before the
+        # first polish so no re-polish is needed later
+        self.setObjectName("modal")
+    
+    @classmethod
+    def get_instance(cls, parent=None, **kwargs):
+        """Return the pooled dialog for this class and parent
         
-        # Center the dialog
-        self.center_dialog()
+        The dialog is built on first use and reused afterwards; callers
+        should call reset() before showing it again.
+        """
+        key = (cls, id(parent))
+        dialog = _dialog_pool.get(key)
+        if dialog is None:
+            dialog = cls(parent=parent, **kwargs)
+            _dialog_pool[key] = dialog
+            dialog.destroyed.connect(lambda: _dialog_pool.pop(key, None))
+        return dialog
+    
+    def reset(self):
+        """Restore the dialog's fields before reuse - to be overridden"""
+        pass
+    
+    def show_warning(self, message):
+        """Show a validation warning, reusing one message box per dialog"""
+        box = self._warn_box
+        if box is None:
+            box = self._warn_box = QMessageBox(
+                QMessageBox.Warning, "Error", "", QMessageBox.Ok, self
+            )
+        box.setText(message)
+        box.exec()
+    
+    def _ensure_centered(self):
+        """Center the dialog on its first show where the WM won't place it"""
+        if not _WM_PLACES_DIALOGS:
+            self.center_dialog()
+    
+    def showEvent(self, event):
+        """Center the dialog the first time it is actually shown"""
+        if not self._centered:
+            self._ensure_centered()
+            self._centered = True
+        super().showEvent(event)
     
     def center_dialog(self):
         """Center the dialog on the screen"""
-        screen = QApplication.primaryScreen().geometry()
-        x = (screen.width() - self.width()) // 2
-        y = (screen.height() - self.height()) // 2
-        self.move(x, y)
+        self.setGeometry(QStyle.alignedRect(
+            Qt.LeftToRight, Qt.AlignCenter, self.size(),
+            QApplication.primaryScreen().availableGeometry()
+        ))
     
     def setup_layout(self):
         """Setup the main layout - to be overridden"""
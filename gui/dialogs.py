@@ -4,32 +4,119 @@ Dialog classes for the Password Manager GUI
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-from pm_core.utils import generate_password, validate_password_strength
+from dataclasses import dataclass
+from tkinter import ttk
+
+
+def _center_dialog(parent, dialog, width, height):
+    """Size and offset a dialog from its parent with a single geometry call"""
+    x = parent.winfo_rootx() + 50
+    y = parent.winfo_rooty() + 50
+    dialog.geometry(f"{width}x{height}+{x}+{y}")
+
+
+def _reveal_dialog(dialog):
+    """Show a dialog built while withdrawn and make it modal"""
+    dialog.update_idletasks()
+    dialog.deiconify()
+    # A grab needs a viewable window, so wait for the map first
+    dialog.wait_visibility()
+    dialog.grab_set()
+
+
+def _build_form(owner, frame, spec, first_row=1, with_vars=False):
+    """Build labelled entry rows from (label, name, show, width) specs
+    
+    Sets owner.<name>_entry and returns the next free row. Fields are read
+    with entry.get(); pass with_vars=True only when something needs to
+    trace them, which also sets owner.<name>_var.
+    """
+    # Bind the constructors and sticky values once for the loop
+    Label, Entry, StringVar = ttk.Label, ttk.Entry, tk.StringVar
+    W, WE = tk.W, (tk.W, tk.E)
+    for row, (label, name, show, width) in enumerate(spec, start=first_row):
+        Label(frame, text=label).grid(row=row, column=0, sticky=W, pady=(0, 5))
+        if with_vars:
+            var = StringVar()
+            entry = Entry(frame, textvariable=var, show=show, width=width)
+            setattr(owner, f"{name}_var", var)
+        else:
+            entry = Entry(frame, show=show, width=width)
+        entry.grid(row=row, column=1, sticky=WE, pady=(0, 10))
+        setattr(owner, f"{name}_entry", entry)
+    return first_row + len(spec)
+
+
+def _set_entry(entry, value):
+    """Replace the text of an Entry that has no textvariable"""
+    entry.delete(0, tk.END)
+    entry.insert(0, value)
+
+
+# Form specs for _build_form: (label, attribute prefix, show, width)
+_VAULT_FORM = (
+    ("Vault Name:", "name", "", 30),
+    ("Master Password:", "password", "*", 30),
+    ("Confirm Password:", "confirm", "*", 30),
+)
+_ENTRY_FORM_HEAD = (
+    ("Title:", "title", "", 40),
+    ("Username:", "username", "", 40),
+)
+_ENTRY_FORM_TAIL = (
+    ("URL:", "url", "", 40),
+)
+
+# GeneratePasswordDialog character-set checkboxes: (attribute, label)
+_GEN_OPTS = (
+    ("include_uppercase", "Include Uppercase"),
+    ("include_lowercase", "Include Lowercase"),
+    ("include_digits", "Include Digits"),
+    ("include_symbols", "Include Symbols"),
+)
+
+
+@dataclass
+class EntryData:
+    """Fields returned by EntryDialog"""
+    # Declared by hand rather than dataclass(slots=True) to keep 3.8 support
+    __slots__ = ("title", "username", "password", "url", "notes")
+    
+    title: str
+    username: str
+    password: str
+    url: str
+    notes: str
 
 
 class CreateVaultDialog:
-    """Dialog for creating a new vault"""
+    """Dialog for creating a new vault
     
-    def __init__(self, parent, vault_manager):
+    Non-blocking: on_result(result) is called once the vault is created.
+    """
+    
+    def __init__(self, parent, vault_manager, on_result=None):
         self.parent = parent
         self.vault_manager = vault_manager
+        self.on_result = on_result
         self.result = None
+        # Strength results per password tried, emptied whenever the dialog
+        # closes so plaintext passwords don't outlive it
+        self._strength = {}
         
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Create New Vault")
-        self.dialog.geometry("400x300")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
+        # Stay hidden while the widgets are built so Tk lays them out once
+        self.dialog.withdraw()
         
-        # Center the dialog
-        self.dialog.geometry("+%d+%d" % (
-            parent.winfo_rootx() + 50,
-            parent.winfo_rooty() + 50
-        ))
+        # Size and position the dialog
+        _center_dialog(parent, self.dialog, 400, 300)
         
         self.setup_ui()
+        _reveal_dialog(self.dialog)
         
     def setup_ui(self):
         """Setup the dialog UI"""
@@ -49,246 +136,113 @@ class CreateVaultDialog:
         )
         title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
         
-        # Vault name
-        ttk.Label(main_frame, text="Vault Name:").grid(
-            row=1, column=0, sticky=tk.W, pady=(0, 5)
-        )
-        self.name_var = tk.StringVar()
-        self.name_entry = ttk.Entry(main_frame, textvariable=self.name_var, width=30)
-        self.name_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        # Password
-        ttk.Label(main_frame, text="Master Password:").grid(
-            row=2, column=0, sticky=tk.W, pady=(0, 5)
-        )
-        self.password_var = tk.StringVar()
-        self.password_entry = ttk.Entry(main_frame, textvariable=self.password_var, 
-                                      show="*", width=30)
-        self.password_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        # Confirm password
-        ttk.Label(main_frame, text="Confirm Password:").grid(
-            row=3, column=0, sticky=tk.W, pady=(0, 5)
-        )
-        self.confirm_var = tk.StringVar()
-        self.confirm_entry = ttk.Entry(main_frame, textvariable=self.confirm_var, 
-                                     show="*", width=30)
-        self.confirm_entry.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=(0, 20))
+        # Vault name, password and confirmation
+        # (traced by _revalidate, so these keep their StringVars)
+        row = _build_form(self, main_frame, _VAULT_FORM, with_vars=True)
         
         # Buttons
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=4, column=0, columnspan=2, pady=(0, 10))
+        button_frame.grid(row=row, column=0, columnspan=2, pady=(10, 10))
         
-        ttk.Button(button_frame, text="Create", command=self.create_vault).pack(
-            side=tk.LEFT, padx=(0, 10)
-        )
+        self.create_btn = ttk.Button(button_frame, text="Create", command=self.create_vault)
+        self.create_btn.pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(button_frame, text="Cancel", command=self.cancel).pack(side=tk.LEFT)
         
+        # Inline error message
+        self.status_lbl = ttk.Label(main_frame, foreground="red", text="")
+        self.status_lbl.grid(row=row + 1, column=0, columnspan=2)
+        
+        # Only enable Create once the form is filled in consistently
+        for var in (self.name_var, self.password_var, self.confirm_var):
+            var.trace_add("write", self._revalidate)
+        self._revalidate()
+        
         # Focus on name entry
         self.name_entry.focus()
         
+    def _password_strength(self, password):
+        """Score a password, reusing the result when the same one is retried"""
+        strength = self._strength.get(password)
+        if strength is None:
+            from pm_core.utils import validate_password_strength
+            strength = self._strength[password] = validate_password_strength(password)
+        return strength
+        
+    def _revalidate(self, *args):
+        """Enable the Create button only when name and matching passwords are set"""
+        password = self.password_var.get()
+        ok = bool(self.name_var.get().strip()) and password != "" and password == self.confirm_var.get()
+        self.create_btn.state(["!disabled" if ok else "disabled"])
+        
     def create_vault(self):
         """Create the vault"""
+        self.status_lbl.configure(text="")
         name = self.name_var.get().strip()
         password = self.password_var.get()
         confirm = self.confirm_var.get()
         
         if not name:
-            messagebox.showerror("Error", "Please enter a vault name")
+            self.status_lbl.configure(text="Please enter a vault name")
             return
             
         if not password:
-            messagebox.showerror("Error", "Please enter a master password")
+            self.status_lbl.configure(text="Please enter a master password")
             return
             
         if password != confirm:
-            messagebox.showerror("Error", "Passwords do not match")
+            self.status_lbl.configure(text="Passwords do not match")
             return
             
-        if not validate_password_strength(password):
-            messagebox.showerror("Error", "Password is too weak")
+        if not self._password_strength(password):
+            self.status_lbl.configure(text="Password is too weak")
             return
             
         try:
             self.vault_manager.create_vault(name, password)
+            self._strength.clear()
             self.result = {"name": name, "password": password}
             self.dialog.destroy()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to create vault: {e}")
-            
-    def cancel(self):
-        """Cancel the dialog"""
-        self.dialog.destroy()
-
-
-class AddEntryDialog:
-    """Dialog for adding a new entry"""
-    
-    def __init__(self, parent, pm):
-        self.parent = parent
-        self.pm = pm
-        self.result = None
-        
-        # Create dialog window
-        self.dialog = tk.Toplevel(parent)
-        self.dialog.title("Add New Entry")
-        self.dialog.geometry("500x400")
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
-        
-        # Center the dialog
-        self.dialog.geometry("+%d+%d" % (
-            parent.winfo_rootx() + 50,
-            parent.winfo_rooty() + 50
-        ))
-        
-        self.setup_ui()
-        
-    def setup_ui(self):
-        """Setup the dialog UI"""
-        main_frame = ttk.Frame(self.dialog, padding="20")
-        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Configure grid weights
-        self.dialog.columnconfigure(0, weight=1)
-        self.dialog.rowconfigure(0, weight=1)
-        main_frame.columnconfigure(1, weight=1)
-        
-        # Title
-        title_label = ttk.Label(
-            main_frame,
-            text="Add New Entry",
-            font=("Arial", 14, "bold")
-        )
-        title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
-        
-        # Title field
-        ttk.Label(main_frame, text="Title:").grid(
-            row=1, column=0, sticky=tk.W, pady=(0, 5)
-        )
-        self.title_var = tk.StringVar()
-        self.title_entry = ttk.Entry(main_frame, textvariable=self.title_var, width=40)
-        self.title_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        # Username field
-        ttk.Label(main_frame, text="Username:").grid(
-            row=2, column=0, sticky=tk.W, pady=(0, 5)
-        )
-        self.username_var = tk.StringVar()
-        self.username_entry = ttk.Entry(main_frame, textvariable=self.username_var, width=40)
-        self.username_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        # Password field
-        ttk.Label(main_frame, text="Password:").grid(
-            row=3, column=0, sticky=tk.W, pady=(0, 5)
-        )
-        password_frame = ttk.Frame(main_frame)
-        password_frame.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        self.password_var = tk.StringVar()
-        self.password_entry = ttk.Entry(password_frame, textvariable=self.password_var, 
-                                      show="*", width=30)
-        self.password_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        ttk.Button(password_frame, text="Generate", 
-                  command=self.generate_password).pack(side=tk.RIGHT, padx=(5, 0))
-        
-        # URL field
-        ttk.Label(main_frame, text="URL:").grid(
-            row=4, column=0, sticky=tk.W, pady=(0, 5)
-        )
-        self.url_var = tk.StringVar()
-        self.url_entry = ttk.Entry(main_frame, textvariable=self.url_var, width=40)
-        self.url_entry.grid(row=4, column=1, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        # Notes field
-        ttk.Label(main_frame, text="Notes:").grid(
-            row=5, column=0, sticky=tk.W, pady=(0, 5)
-        )
-        self.notes_text = tk.Text(main_frame, height=4, width=40)
-        self.notes_text.grid(row=5, column=1, sticky=(tk.W, tk.E), pady=(0, 20))
-        
-        # Buttons
-        button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=6, column=0, columnspan=2, pady=(0, 10))
-        
-        ttk.Button(button_frame, text="Add", command=self.add_entry).pack(
-            side=tk.LEFT, padx=(0, 10)
-        )
-        ttk.Button(button_frame, text="Cancel", command=self.cancel).pack(side=tk.LEFT)
-        
-        # Focus on title entry
-        self.title_entry.focus()
-        
-    def generate_password(self):
-        """Generate a random password"""
-        dialog = GeneratePasswordDialog(self.dialog)
-        self.dialog.wait_window(dialog.dialog)
-        if dialog.result:
-            self.password_var.set(dialog.result)
-            
-    def add_entry(self):
-        """Add the entry"""
-        title = self.title_var.get().strip()
-        username = self.username_var.get().strip()
-        password = self.password_var.get()
-        url = self.url_var.get().strip()
-        notes = self.notes_text.get("1.0", tk.END).strip()
-        
-        if not title:
-            messagebox.showerror("Error", "Please enter a title")
+            self.status_lbl.configure(text=f"Failed to create vault: {e}")
             return
-            
-        if not username:
-            messagebox.showerror("Error", "Please enter a username")
-            return
-            
-        if not password:
-            messagebox.showerror("Error", "Please enter a password")
-            return
-            
-        try:
-            entry_data = {
-                "title": title,
-                "username": username,
-                "password": password,
-                "url": url,
-                "notes": notes
-            }
-            self.result = entry_data
-            self.dialog.destroy()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to add entry: {e}")
+        if self.on_result:
+            self.on_result(self.result)
             
     def cancel(self):
         """Cancel the dialog"""
+        self._strength.clear()
         self.dialog.destroy()
 
 
-class EditEntryDialog:
-    """Dialog for editing an existing entry"""
+class EntryDialog:
+    """Dialog for adding a new entry or editing an existing one
+    
+    Non-blocking: on_result(result) is called with the EntryData on save.
+    """
     
-    def __init__(self, parent, pm, entry):
+    def __init__(self, parent, pm, entry=None, on_result=None):
         self.parent = parent
         self.pm = pm
         self.entry = entry
+        self.on_result = on_result
+        self.mode = "edit" if entry else "add"
         self.result = None
+        self._gen_dialog = None
         
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
-        self.dialog.title("Edit Entry")
-        self.dialog.geometry("500x400")
+        self.dialog.title("Edit Entry" if self.mode == "edit" else "Add New Entry")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
+        # Stay hidden while the widgets are built so Tk lays them out once
+        self.dialog.withdraw()
         
-        # Center the dialog
-        self.dialog.geometry("+%d+%d" % (
-            parent.winfo_rootx() + 50,
-            parent.winfo_rooty() + 50
-        ))
+        # Size and position the dialog
+        _center_dialog(parent, self.dialog, 500, 400)
         
         self.setup_ui()
-        self.load_entry()
+        if self.mode == "edit":
+            self.load_entry()
+        _reveal_dialog(self.dialog)
         
     def setup_ui(self):
         """Setup the dialog UI"""
@@ -303,26 +257,13 @@ class EditEntryDialog:
         # Title
         title_label = ttk.Label(
             main_frame,
-            text="Edit Entry",
+            text="Edit Entry" if self.mode == "edit" else "Add New Entry",
             font=("Arial", 14, "bold")
         )
         title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
         
-        # Title field
-        ttk.Label(main_frame, text="Title:").grid(
-            row=1, column=0, sticky=tk.W, pady=(0, 5)
-        )
-        self.title_var = tk.StringVar()
-        self.title_entry = ttk.Entry(main_frame, textvariable=self.title_var, width=40)
-        self.title_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        # Username field
-        ttk.Label(main_frame, text="Username:").grid(
-            row=2, column=0, sticky=tk.W, pady=(0, 5)
-        )
-        self.username_var = tk.StringVar()
-        self.username_entry = ttk.Entry(main_frame, textvariable=self.username_var, width=40)
-        self.username_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=(0, 10))
+        # Title and username fields
+        _build_form(self, main_frame, _ENTRY_FORM_HEAD)
         
         # Password field
         ttk.Label(main_frame, text="Password:").grid(
@@ -331,21 +272,14 @@ class EditEntryDialog:
         password_frame = ttk.Frame(main_frame)
         password_frame.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=(0, 10))
         
-        self.password_var = tk.StringVar()
-        self.password_entry = ttk.Entry(password_frame, textvariable=self.password_var, 
-                                      show="*", width=30)
+        self.password_entry = ttk.Entry(password_frame, show="*", width=30)
         self.password_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         ttk.Button(password_frame, text="Generate", 
                   command=self.generate_password).pack(side=tk.RIGHT, padx=(5, 0))
         
         # URL field
-        ttk.Label(main_frame, text="URL:").grid(
-            row=4, column=0, sticky=tk.W, pady=(0, 5)
-        )
-        self.url_var = tk.StringVar()
-        self.url_entry = ttk.Entry(main_frame, textvariable=self.url_var, width=40)
-        self.url_entry.grid(row=4, column=1, sticky=(tk.W, tk.E), pady=(0, 10))
+        _build_form(self, main_frame, _ENTRY_FORM_TAIL, first_row=4)
         
         # Notes field
         ttk.Label(main_frame, text="Notes:").grid(
@@ -358,59 +292,84 @@ class EditEntryDialog:
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=6, column=0, columnspan=2, pady=(0, 10))
         
-        ttk.Button(button_frame, text="Update", command=self.update_entry).pack(
-            side=tk.LEFT, padx=(0, 10)
-        )
+        ttk.Button(button_frame, text="Update" if self.mode == "edit" else "Add",
+                  command=self.save_entry).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(button_frame, text="Cancel", command=self.cancel).pack(side=tk.LEFT)
         
+        # Inline error message
+        self.status_lbl = ttk.Label(main_frame, foreground="red", text="")
+        self.status_lbl.grid(row=7, column=0, columnspan=2)
+        
+        # Focus on title entry when adding
+        if self.mode == "add":
+            self.title_entry.focus()
+        
     def load_entry(self):
         """Load the entry data into the form"""
-        self.title_var.set(self.entry.get("title", ""))
-        self.username_var.set(self.entry.get("username", ""))
-        self.password_var.set(self.entry.get("password", ""))
-        self.url_var.set(self.entry.get("url", ""))
+        _set_entry(self.title_entry, self.entry.get("title", ""))
+        _set_entry(self.username_entry, self.entry.get("username", ""))
+        _set_entry(self.password_entry, self.entry.get("password", ""))
+        _set_entry(self.url_entry, self.entry.get("url", ""))
         self.notes_text.delete("1.0", tk.END)
         self.notes_text.insert("1.0", self.entry.get("notes", ""))
         
+    def _get_notes(self):
+        """Read the notes text without Tk's trailing newline"""
+        notes = self.notes_text
+        if notes.compare("end-1c", "==", "1.0"):
+            return ""
+        return notes.get("1.0", "end-1c").strip()
+        
     def generate_password(self):
         """Generate a random password"""
-        dialog = GeneratePasswordDialog(self.dialog)
-        self.dialog.wait_window(dialog.dialog)
-        if dialog.result:
-            self.password_var.set(dialog.result)
+        # Build the generator once and hide/show it on later clicks
+        dialog = self._gen_dialog
+        if dialog is None or not dialog.dialog.winfo_exists():
+            self._gen_dialog = GeneratePasswordDialog(
+                self.dialog, reusable=True, on_result=self._use_generated,
+                on_close=self._generator_closed
+            )
+        else:
+            dialog.reopen()
             
-    def update_entry(self):
-        """Update the entry"""
-        title = self.title_var.get().strip()
-        username = self.username_var.get().strip()
-        password = self.password_var.get()
-        url = self.url_var.get().strip()
-        notes = self.notes_text.get("1.0", tk.END).strip()
+    def _use_generated(self, password):
+        """Fill in the password picked in the generator"""
+        _set_entry(self.password_entry, password)
+        
+    def _generator_closed(self):
+        """Take the grab back from the generator, however it was closed"""
+        if self.dialog.winfo_exists():
+            self.dialog.grab_set()
+            
+    def save_entry(self):
+        """Add or update the entry"""
+        self.status_lbl.configure(text="")
+        title = self.title_entry.get().strip()
+        username = self.username_entry.get().strip()
+        password = self.password_entry.get()
+        url = self.url_entry.get().strip()
+        notes = self._get_notes()
         
         if not title:
-            messagebox.showerror("Error", "Please enter a title")
+            self.status_lbl.configure(text="Please enter a title")
             return
             
         if not username:
-            messagebox.showerror("Error", "Please enter a username")
+            self.status_lbl.configure(text="Please enter a username")
             return
             
         if not password:
-            messagebox.showerror("Error", "Please enter a password")
+            self.status_lbl.configure(text="Please enter a password")
             return
             
         try:
-            entry_data = {
-                "title": title,
-                "username": username,
-                "password": password,
-                "url": url,
-                "notes": notes
-            }
-            self.result = entry_data
+            self.result = EntryData(title, username, password, url, notes)
             self.dialog.destroy()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to update entry: {e}")
+            self.status_lbl.configure(text=f"Failed to {self.mode} entry: {e}")
+            return
+        if self.on_result:
+            self.on_result(self.result)
             
     def cancel(self):
         """Cancel the dialog"""
@@ -418,26 +377,49 @@ class EditEntryDialog:
 
 
 class GeneratePasswordDialog:
-    """Dialog for generating passwords"""
+    """Dialog for generating passwords
     
-    def __init__(self, parent):
+    Non-blocking: on_result(password) is called when "Use" is clicked.
+    on_close() is called whenever the dialog is hidden or destroyed, e.g.
+    so a modal parent can take its grab back.
+    """
+    
+    def __init__(self, parent, reusable=False, on_result=None, on_close=None):
         self.parent = parent
+        self.reusable = reusable
+        self.on_result = on_result
+        self.on_close = on_close
         self.result = None
         
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Generate Password")
-        self.dialog.geometry("400x300")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
+        # Stay hidden while the widgets are built so Tk lays them out once
+        self.dialog.withdraw()
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
         
-        # Center the dialog
-        self.dialog.geometry("+%d+%d" % (
-            parent.winfo_rootx() + 50,
-            parent.winfo_rooty() + 50
-        ))
+        # Size and position the dialog
+        _center_dialog(parent, self.dialog, 400, 300)
         
         self.setup_ui()
+        _reveal_dialog(self.dialog)
+        
+    def reopen(self):
+        """Show a hidden reusable dialog again with a fresh password"""
+        self.result = None
+        self.generate()
+        _reveal_dialog(self.dialog)
+        
+    def close(self):
+        """Hide a reusable dialog, destroy a one-shot one"""
+        if self.reusable:
+            self.dialog.grab_release()
+            self.dialog.withdraw()
+        else:
+            self.dialog.destroy()
+        if self.on_close:
+            self.on_close()
         
     def setup_ui(self):
         """Setup the dialog UI"""
@@ -461,40 +443,26 @@ class GeneratePasswordDialog:
         ttk.Label(main_frame, text="Length:").grid(
             row=1, column=0, sticky=tk.W, pady=(0, 5)
         )
-        self.length_var = tk.IntVar(value=16)
-        self.length_spinbox = ttk.Spinbox(main_frame, from_=8, to=64, 
-                                         textvariable=self.length_var, width=10)
+        self.length_spinbox = ttk.Spinbox(main_frame, from_=8, to=64, width=10)
+        self.length_spinbox.set(16)
         self.length_spinbox.grid(row=1, column=1, sticky=tk.W, pady=(0, 10))
         
         # Options
-        self.include_uppercase = tk.BooleanVar(value=True)
-        ttk.Checkbutton(main_frame, text="Include Uppercase", 
-                       variable=self.include_uppercase).grid(
-            row=2, column=0, columnspan=2, sticky=tk.W, pady=(0, 5)
-        )
-        
-        self.include_lowercase = tk.BooleanVar(value=True)
-        ttk.Checkbutton(main_frame, text="Include Lowercase", 
-                       variable=self.include_lowercase).grid(
-            row=3, column=0, columnspan=2, sticky=tk.W, pady=(0, 5)
-        )
-        
-        self.include_digits = tk.BooleanVar(value=True)
-        ttk.Checkbutton(main_frame, text="Include Digits", 
-                       variable=self.include_digits).grid(
-            row=4, column=0, columnspan=2, sticky=tk.W, pady=(0, 5)
-        )
-        
-        self.include_symbols = tk.BooleanVar(value=True)
-        ttk.Checkbutton(main_frame, text="Include Symbols", 
-                       variable=self.include_symbols).grid(
-            row=5, column=0, columnspan=2, sticky=tk.W, pady=(0, 20)
-        )
+        Checkbutton, BooleanVar = ttk.Checkbutton, tk.BooleanVar
+        last_row = len(_GEN_OPTS) + 1
+        for row, (attr, label) in enumerate(_GEN_OPTS, start=2):
+            var = BooleanVar(value=True)
+            setattr(self, attr, var)
+            Checkbutton(main_frame, text=label, variable=var).grid(
+                row=row, column=0, columnspan=2, sticky=tk.W,
+                pady=(0, 20 if row == last_row else 5)
+            )
         
         # Generated password
         ttk.Label(main_frame, text="Generated Password:").grid(
             row=6, column=0, sticky=tk.W, pady=(0, 5)
         )
+        # Read-only entries can't be written with insert(), so keep a var here
         self.password_var = tk.StringVar()
         self.password_entry = ttk.Entry(main_frame, textvariable=self.password_var, 
                                       width=30, state="readonly")
@@ -512,13 +480,19 @@ class GeneratePasswordDialog:
         )
         ttk.Button(button_frame, text="Cancel", command=self.cancel).pack(side=tk.LEFT)
         
+        # Inline error message
+        self.status_lbl = ttk.Label(main_frame, foreground="red", text="")
+        self.status_lbl.grid(row=8, column=0, columnspan=2)
+        
         # Generate initial password
         self.generate()
         
     def generate(self):
         """Generate a new password"""
+        from pm_core.utils import generate_password
+        self.status_lbl.configure(text="")
         try:
-            length = self.length_var.get()
+            length = int(self.length_spinbox.get())
             password = generate_password(
                 length=length,
                 include_uppercase=self.include_uppercase.get(),
@@ -528,15 +502,17 @@ class GeneratePasswordDialog:
             )
             self.password_var.set(password)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate password: {e}")
+            self.status_lbl.configure(text=f"Failed to generate password: {e}")
             
     def use_password(self):
         """Use the generated password"""
         password = self.password_var.get()
         if password:
             self.result = password
-            self.dialog.destroy()
+            self.close()
+            if self.on_result:
+                self.on_result(password)
             
     def cancel(self):
         """Cancel the dialog"""
-        self.dialog.destroy() 
\ No newline at end of file
+        self.close() 
\ No newline at end of file
@@ -4,16 +4,72 @@ PySide6-based dialogs for the Password Manager GUI
 Modern, responsive dialogs with better UX
 """
 
+import functools
+from dataclasses import dataclass
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLineEdit, QTextEdit, QPushButton, QLabel, QCheckBox,
     QSpinBox, QComboBox, QMessageBox, QGroupBox, QGridLayout,
     QApplication, QMainWindow
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QFont
 
-from .components_pyside import DialogBase, ModernButton
+from pm_core.models_pydantic import PasswordGenerationConfig, generate_password_from_config
+
+from .components_pyside import DialogBase, ModernButton, set_clipboard_text
+
+
+@functools.lru_cache(maxsize=1)
+def _password_font():
+    """Monospace font shared by every generated-password display"""
+    font = QFont("Courier New")
+    font.setStyleHint(QFont.Monospace)
+    font.setPixelSize(14)
+    return font
+
+
+@dataclass
+class EntryFormWidgets:
+    """Input widgets shared by AddEntryDialog and EditEntryDialog"""
+    name_input: QLineEdit
+    username_input: QLineEdit
+    password_input: QLineEdit
+    show_password_checkbox: QCheckBox
+    url_input: QLineEdit
+    notes_input: QTextEdit
+
+
+def _build_entry_form(form_layout):
+    """Add the entry fields to a QFormLayout and return them"""
+    name_input = QLineEdit()
+    name_input.setPlaceholderText("Enter entry name")
+    form_layout.addRow("Name:", name_input)
+    
+    username_input = QLineEdit()
+    username_input.setPlaceholderText("Enter username")
+    form_layout.addRow("Username:", username_input)
+    
+    password_input = QLineEdit()
+    password_input.setEchoMode(QLineEdit.Password)
+    password_input.setPlaceholderText("Enter password")
+    form_layout.addRow("Password:", password_input)
+    
+    show_password_checkbox = QCheckBox("Show password")
+    form_layout.addRow("", show_password_checkbox)
+    
+    url_input = QLineEdit()
+    url_input.setPlaceholderText("https://example.com")
+    form_layout.addRow("URL:", url_input)
+    
+    notes_input = QTextEdit()
+    notes_input.setMaximumHeight(100)
+    notes_input.setPlaceholderText("Optional notes")
+    form_layout.addRow("Notes:", notes_input)
+    
+    return EntryFormWidgets(name_input, username_input, password_input,
+                            show_password_checkbox, url_input, notes_input)
 
 
 class CreateVaultDialog(DialogBase):
@@ -64,13 +120,21 @@ class CreateVaultDialog(DialogBase):
         self.create_button.clicked.connect(self.create_vault)
         
         self.cancel_button = ModernButton("Cancel")
-        self.cancel_button.clicked.connect(self.close)
+        self.cancel_button.clicked.connect(self.reject)
         
         button_layout.addWidget(self.create_button)
         button_layout.addWidget(self.cancel_button)
         
         layout.addLayout(button_layout)
     
+    def reset(self):
+        """Clear the inputs before the dialog is reopened"""
+        self.name_input.clear()
+        self.password_input.clear()
+        self.confirm_password_input.clear()
+        self.description_input.clear()
+    
+    @Slot()
     def create_vault(self):
         """Create the vault with validation"""
         name = self.name_input.text().strip()
@@ -80,24 +144,24 @@ class CreateVaultDialog(DialogBase):
         
         # Validation
         if not name:
-            QMessageBox.warning(self, "Error", "Vault name is required!")
+            self.show_warning("Vault name is required!")
             return
         
         if not password:
-            QMessageBox.warning(self, "Error", "Master password is required!")
+            self.show_warning("Master password is required!")
             return
         
         if password != confirm_password:
-            QMessageBox.warning(self, "Error", "Passwords do not match!")
+            self.show_warning("Passwords do not match!")
             return
         
         if len(password) < 8:
-            QMessageBox.warning(self, "Error", "Password must be at least 8 characters long!")
+            self.show_warning("Password must be at least 8 characters long!")
             return
         
-        # Emit signal and close
+        # Emit signal and accept
         self.vault_created.emit(name, password, description)
-        self.close()
+        self.accept()
 
 
 class AddEntryDialog(DialogBase):
@@ -115,38 +179,14 @@ class AddEntryDialog(DialogBase):
         
         # Form layout for inputs
         form_layout = QFormLayout()
-        
-        # Entry name
-        self.name_input = QLineEdit()
-        self.name_input.setPlaceholderText("Enter entry name")
-        form_layout.addRow("Name:", self.name_input)
-        
-        # Username
-        self.username_input = QLineEdit()
-        self.username_input.setPlaceholderText("Enter username")
-        form_layout.addRow("Username:", self.username_input)
-        
-        # Password
-        self.password_input = QLineEdit()
-        self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.setPlaceholderText("Enter password")
-        form_layout.addRow("Password:", self.password_input)
-        
-        # Show password checkbox
-        self.show_password_checkbox = QCheckBox("Show password")
+        form = self.form = _build_entry_form(form_layout)
+        self.name_input = form.name_input
+        self.username_input = form.username_input
+        self.password_input = form.password_input
+        self.show_password_checkbox = form.show_password_checkbox
+        self.url_input = form.url_input
+        self.notes_input = form.notes_input
         self.show_password_checkbox.toggled.connect(self.toggle_password_visibility)
-        form_layout.addRow("", self.show_password_checkbox)
-        
-        # URL
-        self.url_input = QLineEdit()
-        self.url_input.setPlaceholderText("https://example.com")
-        form_layout.addRow("URL:", self.url_input)
-        
-        # Notes
-        self.notes_input = QTextEdit()
-        self.notes_input.setMaximumHeight(100)
-        self.notes_input.setPlaceholderText("Optional notes")
-        form_layout.addRow("Notes:", self.notes_input)
         
         layout.addLayout(form_layout)
         
@@ -157,13 +197,23 @@ class AddEntryDialog(DialogBase):
         self.add_button.clicked.connect(self.add_entry)
         
         self.cancel_button = ModernButton("Cancel")
-        self.cancel_button.clicked.connect(self.close)
+        self.cancel_button.clicked.connect(self.reject)
         
         button_layout.addWidget(self.add_button)
         button_layout.addWidget(self.cancel_button)
         
         layout.addLayout(button_layout)
     
+    def reset(self):
+        """Clear the inputs before the dialog is reopened"""
+        self.name_input.clear()
+        self.username_input.clear()
+        self.password_input.clear()
+        self.show_password_checkbox.setChecked(False)
+        self.url_input.clear()
+        self.notes_input.clear()
+    
+    @Slot(bool)
     def toggle_password_visibility(self, checked):
         """Toggle password visibility"""
         if checked:
@@ -171,35 +221,33 @@ class AddEntryDialog(DialogBase):
         else:
             self.password_input.setEchoMode(QLineEdit.Password)
     
+    @Slot()
     def add_entry(self):
         """Add the entry with validation"""
         name = self.name_input.text().strip()
-        username = self.username_input.text().strip()
         password = self.password_input.text()
-        url = self.url_input.text().strip()
-        notes = self.notes_input.toPlainText().strip()
         
-        # Validation
+        # Validation (the optional fields are only read once it passes)
         if not name:
-            QMessageBox.warning(self, "Error", "Entry name is required!")
+            self.show_warning("Entry name is required!")
             return
         
         if not password:
-            QMessageBox.warning(self, "Error", "Password is required!")
+            self.show_warning("Password is required!")
             return
         
         # Create entry data
         entry_data = {
             "name": name,
-            "username": username,
+            "username": self.username_input.text().strip(),
             "password": password,
-            "url": url,
-            "notes": notes
+            "url": self.url_input.text().strip(),
+            "notes": self.notes_input.toPlainText().strip()
         }
         
-        # Emit signal and close
+        # Emit signal and accept
         self.entry_added.emit(entry_data)
-        self.close()
+        self.accept()
 
 
 class EditEntryDialog(DialogBase):
@@ -219,38 +267,14 @@ class EditEntryDialog(DialogBase):
         
         # Form layout for inputs
         form_layout = QFormLayout()
-        
-        # Entry name
-        self.name_input = QLineEdit()
-        self.name_input.setPlaceholderText("Enter entry name")
-        form_layout.addRow("Name:", self.name_input)
-        
-        # Username
-        self.username_input = QLineEdit()
-        self.username_input.setPlaceholderText("Enter username")
-        form_layout.addRow("Username:", self.username_input)
-        
-        # Password
-        self.password_input = QLineEdit()
-        self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.setPlaceholderText("Enter password")
-        form_layout.addRow("Password:", self.password_input)
-        
-        # Show password checkbox
-        self.show_password_checkbox = QCheckBox("Show password")
+        form = self.form = _build_entry_form(form_layout)
+        self.name_input = form.name_input
+        self.username_input = form.username_input
+        self.password_input = form.password_input
+        self.show_password_checkbox = form.show_password_checkbox
+        self.url_input = form.url_input
+        self.notes_input = form.notes_input
         self.show_password_checkbox.toggled.connect(self.toggle_password_visibility)
-        form_layout.addRow("", self.show_password_checkbox)
-        
-        # URL
-        self.url_input = QLineEdit()
-        self.url_input.setPlaceholderText("https://example.com")
-        form_layout.addRow("URL:", self.url_input)
-        
-        # Notes
-        self.notes_input = QTextEdit()
-        self.notes_input.setMaximumHeight(100)
-        self.notes_input.setPlaceholderText("Optional notes")
-        form_layout.addRow("Notes:", self.notes_input)
         
         layout.addLayout(form_layout)
         
@@ -261,7 +285,7 @@ class EditEntryDialog(DialogBase):
         self.update_button.clicked.connect(self.update_entry)
         
         self.cancel_button = ModernButton("Cancel")
-        self.cancel_button.clicked.connect(self.close)
+        self.cancel_button.clicked.connect(self.reject)
         
         button_layout.addWidget(self.update_button)
         button_layout.addWidget(self.cancel_button)
@@ -276,6 +300,14 @@ class EditEntryDialog(DialogBase):
         self.url_input.setText(self.entry_data.get("url", ""))
         self.notes_input.setPlainText(self.entry_data.get("notes", ""))
     
+    def reset(self, entry_data=None):
+        """Load another entry (or reload the current one) before reopening"""
+        if entry_data is not None:
+            self.entry_data = entry_data
+        self.show_password_checkbox.setChecked(False)
+        self.populate_fields()
+    
+    @Slot(bool)
     def toggle_password_visibility(self, checked):
         """Toggle password visibility"""
         if checked:
@@ -283,36 +315,41 @@ class EditEntryDialog(DialogBase):
         else:
             self.password_input.setEchoMode(QLineEdit.Password)
     
+    @Slot()
     def update_entry(self):
         """Update the entry with validation"""
         name = self.name_input.text().strip()
-        username = self.username_input.text().strip()
         password = self.password_input.text()
-        url = self.url_input.text().strip()
-        notes = self.notes_input.toPlainText().strip()
         
-        # Validation
+        # Validation (the optional fields are only read once it passes)
         if not name:
-            QMessageBox.warning(self, "Error", "Entry name is required!")
+            self.show_warning("Entry name is required!")
             return
         
         if not password:
-            QMessageBox.warning(self, "Error", "Password is required!")
+            self.show_warning("Password is required!")
             return
         
         # Create updated entry data
         entry_data = {
             "id": self.entry_data.get("id"),
             "name": name,
-            "username": username,
+            "username": self.username_input.text().strip(),
             "password": password,
-            "url": url,
-            "notes": notes
+            "url": self.url_input.text().strip(),
+            "notes": self.notes_input.toPlainText().strip()
         }
         
-        # Emit signal and close
+        # Nothing was edited: dismiss without a save and list refresh
+        original = self.entry_data
+        if all((original.get(key) or "") == value
+               for key, value in entry_data.items() if key != "id"):
+            self.reject()
+            return
+        
+        # Emit signal and accept
         self.entry_updated.emit(entry_data)
-        self.close()
+        self.accept()
 
 
 class GeneratePasswordDialog(DialogBase):
@@ -363,13 +400,9 @@ class GeneratePasswordDialog(DialogBase):
         
         self.password_display = QLineEdit()
         self.password_display.setReadOnly(True)
-        self.password_display.setStyleSheet("""
-            QLineEdit {
-                font-family: 'Courier New', monospace;
-                font-size: 14px;
-                padding: 8px;
-            }
-        """)
+        # Padding and size under the theme come from style.qss
+        self.password_display.setObjectName("passwordDisplay")
+        self.password_display.setFont(_password_font())
         password_layout.addWidget(self.password_display)
         
         # Generate button
@@ -389,7 +422,7 @@ class GeneratePasswordDialog(DialogBase):
         self.use_button.clicked.connect(self.use_password)
         
         self.cancel_button = ModernButton("Cancel")
-        self.cancel_button.clicked.connect(self.close)
+        self.cancel_button.clicked.connect(self.reject)
         
         button_layout.addWidget(self.copy_button)
         button_layout.addWidget(self.use_button)
@@ -400,12 +433,16 @@ class GeneratePasswordDialog(DialogBase):
         # Generate initial password
         self.generate_password()
     
+    def reset(self):
+        """Offer a fresh password each time the dialog is reopened"""
+        self.generate_password()
+    
+    @Slot()
     def generate_password(self):
         """Generate a new password"""
         try:
-            from pm_core.models_pydantic import PasswordGenerationConfig, generate_password_from_config
-            
-            config = PasswordGenerationConfig(
+            # The widgets already bound every field, so skip pydantic validation
+            config = PasswordGenerationConfig.model_construct(
                 length=self.length_spinbox.value(),
                 include_uppercase=self.uppercase_checkbox.isChecked(),
                 include_lowercase=self.lowercase_checkbox.isChecked(),
@@ -419,20 +456,18 @@ class GeneratePasswordDialog(DialogBase):
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to generate password: {e}")
     
+    @Slot()
     def copy_to_clipboard(self):
         """Copy password to clipboard"""
         password = self.password_display.text()
         if password:
-            try:
-                import pyperclip
-                pyperclip.copy(password)
-                QMessageBox.information(self, "Success", "Password copied to clipboard!")
-            except ImportError:
-                QMessageBox.warning(self, "Error", "pyperclip not available for clipboard operations")
+            set_clipboard_text(password)
+            QMessageBox.information(self, "Success", "Password copied to clipboard!")
     
+    @Slot()
     def use_password(self):
         """Use the generated password"""
         password = self.password_display.text()
         if password:
             self.password_generated.emit(password)
-            self.close() 
\ No newline at end of file
+            self.accept() 
\ No newline at end of file
@@ -4,71 +4,127 @@ Event handling for the Password Manager GUI
 """
 
 import tkinter as tk
+from dataclasses import asdict
 from tkinter import messagebox
-from .dialogs import CreateVaultDialog, AddEntryDialog, EditEntryDialog
+from .dialogs import CreateVaultDialog, EntryDialog, GeneratePasswordDialog
 
 
 class EventHandler:
     """Centralized event handling for the GUI"""
     
+    # Delay before filtering, so a burst of keystrokes filters only once
+    SEARCH_DEBOUNCE_MS = 150
+    
+    # Ctrl+<keysym> -> EventHandler method, looked up once per key press
+    _CTRL_SHORTCUTS = {
+        'n': 'add_entry',
+        'f': '_focus_search',
+        's': '_save_vault',
+        'o': '_open_selected_vault',
+    }
+    
     def __init__(self, gui):
         self.gui = gui
+        self._search_after_id = None
+        # Tree item ids last reported by <<TreeviewSelect>>, so the button
+        # handlers don't have to ask Tk for the selection again. Only valid
+        # while those rows exist: whoever replaces the entry rows must call
+        # clear_entry_selection(), since item ids can be reused
+        self._vault_item = None
+        self._entry_item = None
+        
+    def _selected_vault(self):
+        """Name of the selected vault, or None"""
+        # vault_names is rebuilt on refresh, so a stale item id finds nothing
+        return self.gui.vault_names.get(self._vault_item)
+        
+    def _selected_entry(self):
+        """Data of the selected entry, or None"""
+        # Relies on _entry_item being cleared whenever the rows are replaced
+        if self._entry_item not in self.gui.entry_ids:
+            return None
+        return self.gui.get_selected_entry_data(self._entry_item)
         
     def on_vault_select(self, event):
         """Handle vault selection"""
         selection = self.gui.vaults_tree.selection()
-        if selection:
-            vault_name = self.gui.vaults_tree.item(selection[0])["values"][0]
-            self.gui.current_vault = vault_name
+        self._vault_item = selection[0] if selection else None
+        vault_name = self._selected_vault()
+        if vault_name is not None:
+            self.gui.load_vault_info(self._vault_item)
+            self.gui.set_current_vault(vault_name)
             self.gui.refresh_entries()
             
+    def on_entry_select(self, event):
+        """Remember which entry is selected"""
+        selection = self.gui.entries_tree.selection()
+        self._entry_item = selection[0] if selection else None
+        
+    def clear_entry_selection(self):
+        """Forget the selected entry once its row is gone"""
+        self._entry_item = None
+            
     def on_vault_double_click(self, event):
         """Handle vault double-click (open vault)"""
-        selection = self.gui.vaults_tree.selection()
-        if selection:
-            vault_name = self.gui.vaults_tree.item(selection[0])["values"][0]
+        vault_name = self._selected_vault()
+        if vault_name is not None:
             self.gui.open_vault(vault_name)
             
     def on_entry_double_click(self, event):
         """Handle entry double-click (view entry)"""
-        selection = self.gui.entries_tree.selection()
-        if selection:
+        if self._entry_item in self.gui.entry_ids:
             self.gui.view_entry()
             
     def on_search_change(self, *args):
-        """Handle search text changes"""
-        search_term = self.gui.search_var.get().lower()
+        """Handle search text changes by (re)scheduling a filter pass"""
+        if self._search_after_id is not None:
+            self.gui.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.gui.root.after(self.SEARCH_DEBOUNCE_MS, self._do_filter)
+        
+    def _do_filter(self):
+        """Filter entries once typing has paused"""
+        self._search_after_id = None
+        search_term = self.gui.search_box.get_value().casefold()
         self.gui.filter_entries(search_term)
         
     def on_key_press(self, event):
         """Handle keyboard shortcuts"""
         if event.state & 4:  # Ctrl key
-            if event.keysym == 'n':
-                self.gui.add_entry()
-            elif event.keysym == 'f':
-                self.gui.search_entry.focus()
-            elif event.keysym == 's':
-                self.gui.save_vault()
-            elif event.keysym == 'o':
-                self.gui.open_vault_dialog()
+            handler = self._CTRL_SHORTCUTS.get(event.keysym)
+            if handler:
+                getattr(self, handler)()
+                
+    def _focus_search(self):
+        """Move keyboard focus to the search box"""
+        self.gui.search_box.entry.focus()
+        
+    def _save_vault(self):
+        """Save the current vault"""
+        self.gui.save_vault()
+        
+    def _open_selected_vault(self):
+        """Open the vault selected in the vaults list"""
+        vault_name = self._selected_vault()
+        if vault_name is not None:
+            self.gui.open_vault(vault_name)
                 
     def create_vault(self):
         """Handle create vault button click"""
-        dialog = CreateVaultDialog(self.gui.root, self.gui.vault_manager)
-        self.gui.root.wait_window(dialog.dialog)
+        CreateVaultDialog(self.gui.root, self.gui.vault_manager,
+                          on_result=self._on_vault_created)
         
-        if dialog.result:
-            self.gui.refresh_vaults_list()
-            messagebox.showinfo("Success", f"Vault '{dialog.result['name']}' created successfully!")
+    def _on_vault_created(self, result):
+        """Refresh the vault list once CreateVaultDialog succeeds"""
+        self.gui.refresh_vaults_list()
+        messagebox.showinfo("Success", f"Vault '{result['name']}' created successfully!")
             
     def delete_vault(self):
         """Handle delete vault button click"""
-        selection = self.gui.vaults_tree.selection()
-        if not selection:
+        vault_name = self._selected_vault()
+        if vault_name is None:
             messagebox.showwarning("Warning", "Please select a vault to delete")
             return
             
-        vault_name = self.gui.vaults_tree.item(selection[0])["values"][0]
         
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete vault '{vault_name}'?"):
             try:
@@ -80,12 +136,11 @@ class EventHandler:
                 
     def rename_vault(self):
         """Handle rename vault button click"""
-        selection = self.gui.vaults_tree.selection()
-        if not selection:
+        vault_name = self._selected_vault()
+        if vault_name is None:
             messagebox.showwarning("Warning", "Please select a vault to rename")
             return
             
-        vault_name = self.gui.vaults_tree.item(selection[0])["values"][0]
         new_name = tk.simpledialog.askstring("Rename Vault", 
                                            f"Enter new name for vault '{vault_name}':",
                                            initialvalue=vault_name)
@@ -100,12 +155,11 @@ class EventHandler:
                 
     def backup_vault(self):
         """Handle backup vault button click"""
-        selection = self.gui.vaults_tree.selection()
-        if not selection:
+        vault_name = self._selected_vault()
+        if vault_name is None:
             messagebox.showwarning("Warning", "Please select a vault to backup")
             return
             
-        vault_name = self.gui.vaults_tree.item(selection[0])["values"][0]
         
         try:
             backup_path = self.gui.vault_manager.backup_vault(vault_name)
@@ -119,71 +173,80 @@ class EventHandler:
             messagebox.showwarning("Warning", "Please select a vault first")
             return
             
-        dialog = AddEntryDialog(self.gui.root, self.gui)
-        self.gui.root.wait_window(dialog.dialog)
+        EntryDialog(self.gui.root, self.gui, on_result=self._on_entry_added)
         
-        if dialog.result:
-            try:
-                self.gui.vault_manager.add_entry(self.gui.current_vault, dialog.result)
-                self.gui.refresh_entries()
-                messagebox.showinfo("Success", "Entry added successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to add entry: {e}")
+    def _run_entry_change(self, action, done, fn, apply_row, *args):
+        """Run a vault_manager entry change on the worker thread
+        
+        It is queued behind any entries refresh already running, so the
+        refresh can't overwrite the change; apply_row(result) then updates
+        the list, unless another vault was selected meanwhile.
+        """
+        vault = self.gui.current_vault
+        
+        def on_done(result):
+            if vault == self.gui.current_vault:
+                apply_row(result)
+            messagebox.showinfo("Success", f"Entry {done} successfully!")
+            
+        def on_error(e):
+            messagebox.showerror("Error", f"Failed to {action} entry: {e}")
+            
+        self.gui.run_in_background(fn, on_done, on_error, vault, *args)
+        
+    def _on_entry_added(self, result):
+        """Store the entry returned by an add EntryDialog"""
+        self._run_entry_change(
+            "add", "added",
+            self.gui.vault_manager.add_entry,
+            lambda entry_id: self.gui.insert_entry_row({"id": entry_id, **asdict(result)}),
+            result
+        )
                 
     def edit_entry(self):
         """Handle edit entry button click"""
-        selection = self.gui.entries_tree.selection()
-        if not selection:
+        entry_data = self._selected_entry()
+        if entry_data is None:
             messagebox.showwarning("Warning", "Please select an entry to edit")
             return
             
-        entry_data = self.gui.get_selected_entry_data()
-        if not entry_data:
-            return
-            
-        dialog = EditEntryDialog(self.gui.root, self.gui, entry_data)
-        self.gui.root.wait_window(dialog.dialog)
+        item, entry_id = self._entry_item, entry_data["id"]
+        EntryDialog(self.gui.root, self.gui, entry_data,
+                    on_result=lambda result: self._on_entry_updated(item, entry_id, result))
         
-        if dialog.result:
-            try:
-                self.gui.vault_manager.update_entry(self.gui.current_vault, 
-                                                  entry_data["id"], dialog.result)
-                self.gui.refresh_entries()
-                messagebox.showinfo("Success", "Entry updated successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to update entry: {e}")
+    def _on_entry_updated(self, item, entry_id, result):
+        """Store the changes returned by an edit EntryDialog"""
+        self._run_entry_change(
+            "update", "updated",
+            self.gui.vault_manager.update_entry,
+            lambda _: self.gui.update_entry_row(item, {"id": entry_id, **asdict(result)}),
+            entry_id, result
+        )
                 
     def delete_entry(self):
         """Handle delete entry button click"""
-        selection = self.gui.entries_tree.selection()
-        if not selection:
+        entry_data = self._selected_entry()
+        if entry_data is None:
             messagebox.showwarning("Warning", "Please select an entry to delete")
             return
             
-        entry_data = self.gui.get_selected_entry_data()
-        if not entry_data:
-            return
-            
         if messagebox.askyesno("Confirm Delete", 
                               f"Are you sure you want to delete entry '{entry_data['title']}'?"):
-            try:
-                self.gui.vault_manager.delete_entry(self.gui.current_vault, entry_data["id"])
-                self.gui.refresh_entries()
-                messagebox.showinfo("Success", "Entry deleted successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to delete entry: {e}")
+            item, entry_id = self._entry_item, entry_data["id"]
+            self._run_entry_change(
+                "delete", "deleted",
+                self.gui.vault_manager.delete_entry,
+                lambda _: self.gui.delete_entry_row(item, entry_id),
+                entry_id
+            )
                 
     def copy_password(self):
         """Handle copy password button click"""
-        selection = self.gui.entries_tree.selection()
-        if not selection:
+        entry_data = self._selected_entry()
+        if entry_data is None:
             messagebox.showwarning("Warning", "Please select an entry to copy password")
             return
             
-        entry_data = self.gui.get_selected_entry_data()
-        if not entry_data:
-            return
-            
         try:
             from pm_core.utils import clipboard_handler
             clipboard_handler(entry_data["password"])
@@ -193,20 +256,18 @@ class EventHandler:
             
     def generate_password(self):
         """Handle generate password button click"""
-        from .dialogs import GeneratePasswordDialog
-        
-        dialog = GeneratePasswordDialog(self.gui.root)
-        self.gui.root.wait_window(dialog.dialog)
+        GeneratePasswordDialog(self.gui.root, on_result=self._on_password_generated)
         
-        if dialog.result:
-            # This could be used to populate a password field in a dialog
-            messagebox.showinfo("Generated Password", f"Generated password: {dialog.result}")
+    def _on_password_generated(self, password):
+        """Show the password picked in GeneratePasswordDialog"""
+        # This could be used to populate a password field in a dialog
+        messagebox.showinfo("Generated Password", f"Generated password: {password}")
             
     def refresh_data(self):
         """Handle refresh button click"""
+        # Both refreshes report their outcome in the status bar
         self.gui.refresh_vaults_list()
         self.gui.refresh_entries()
-        messagebox.showinfo("Success", "Data refreshed successfully!")
         
     def show_about(self):
         """Handle about button click"""
@@ -4,15 +4,58 @@ PySide6-based event handler for the Password Manager GUI
 Handles all user interactions and business logic
 """
 
-from PySide6.QtCore import QObject, Signal, QTimer
-from PySide6.QtWidgets import QMessageBox, QInputDialog
+import functools
+from collections import deque
+
+from PySide6.QtCore import Qt, QObject, Signal, Slot, QTimer, QRunnable, QThreadPool
+from PySide6.QtWidgets import QMessageBox, QInputDialog, QLineEdit
 from PySide6.QtGui import QKeySequence
 
+from .components_pyside import set_clipboard_text
 from .dialogs_pyside import (
     CreateVaultDialog, AddEntryDialog, EditEntryDialog, GeneratePasswordDialog
 )
 
 
+def _gui_guard(message):
+    """Show exceptions from an EventHandler method in an error box titled by message"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return fn(self, *args, **kwargs)
+            except Exception as e:
+                QMessageBox.critical(self.main_window, "Error", f"{message}: {e}")
+        return wrapper
+    return decorator
+
+
+class _TaskSignals(QObject):
+    """Signals a _VaultTask uses to report back to the GUI thread"""
+    
+    finished = Signal(object)  # return value of the call
+    error = Signal(str)
+
+
+class _VaultTask(QRunnable):
+    """Run one slow vault_manager call (KDF + decrypt) on the thread pool"""
+    
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        # Created on the GUI thread, so its slots run there too
+        self.signals = _TaskSignals()
+    
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
 class EventHandler(QObject):
     """Event handler for the password manager GUI"""
     
@@ -26,380 +69,528 @@ class EventHandler(QObject):
     password_copied = Signal(str)
     status_updated = Signal(str)
     
+    # (key, modifiers) -> EventHandler method, looked up once per key press
+    _KEY_SHORTCUTS = {
+        (Qt.Key_N, Qt.ControlModifier): 'add_entry',
+        (Qt.Key_E, Qt.ControlModifier): 'edit_entry',
+        (Qt.Key_Delete, Qt.NoModifier): 'delete_entry',
+        (Qt.Key_Delete, Qt.KeypadModifier): 'delete_entry',
+        (Qt.Key_C, Qt.ControlModifier): 'copy_password',
+        (Qt.Key_G, Qt.ControlModifier): 'generate_password',
+    }
+    
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
         self.vault_manager = main_window.vault_manager
         self.current_vault = None
         self.current_entries = []
+        # Lookups into current_entries, rebuilt by set_current_entries
+        self._entries_by_name = {}
+        self._entries_by_id = {}
+        # Vault task running on the thread pool, and the ones waiting for
+        # it as (action, on_finished, fn, args, on_error); see _run_vault_task
+        self._task = None
+        self._queued_tasks = deque()
+        # Entry loads: only the result of the newest one is shown, see
+        # load_entries. _loads_pending counts loads queued or running
+        self._load_seq = 0
+        self._loads_pending = 0
+        self._on_entries_loaded = None
+        # Set while a refresh_entries() call is queued, see _schedule_refresh
+        self._refresh_pending = False
+        # Tree managers, bound by bind_views() once the main window's UI exists
+        self._vaults_mgr = None
+        self._entries_mgr = None
+        self._refresh_entries = main_window.refresh_entries
         
-        # Connect signals
-        self.vault_created.connect(self.main_window.on_vault_created)
-        self.vault_opened.connect(self.main_window.on_vault_opened)
-        self.vault_closed.connect(self.main_window.on_vault_closed)
-        self.entry_added.connect(self.main_window.on_entry_added)
-        self.entry_updated.connect(self.main_window.on_entry_updated)
-        self.entry_deleted.connect(self.main_window.on_entry_deleted)
-        self.password_copied.connect(self.main_window.on_password_copied)
-        self.status_updated.connect(self.main_window.on_status_updated)
+        # Connect signals. These are only emitted on the GUI thread (worker
+        # results arrive through _TaskSignals first), so call slots directly
+        direct = Qt.DirectConnection
+        self.vault_created.connect(self.main_window.on_vault_created, direct)
+        self.vault_opened.connect(self.main_window.on_vault_opened, direct)
+        self.vault_closed.connect(self.main_window.on_vault_closed, direct)
+        self.entry_added.connect(self.main_window.on_entry_added, direct)
+        self.entry_updated.connect(self.main_window.on_entry_updated, direct)
+        self.entry_deleted.connect(self.main_window.on_entry_deleted, direct)
+        self.status_updated.connect(self.main_window.on_status_updated, direct)
+    
+    def bind_views(self):
+        """Keep direct references to the main window's tree managers"""
+        self._vaults_mgr = self.main_window.vaults_manager
+        self._entries_mgr = self.main_window.entries_manager
+    
+    def prebuild_dialogs(self):
+        """Build the pooled dialogs ahead of their first use"""
+        parent = self.main_window
+        CreateVaultDialog.get_instance(parent)
+        AddEntryDialog.get_instance(parent)
+        EditEntryDialog.get_instance(parent, entry_data={})
+        GeneratePasswordDialog.get_instance(parent)
     
+    def _schedule_refresh(self):
+        """Reload the entry list once the current event has been handled
+        
+        Any number of calls in the same event-loop turn share one
+        refresh_entries().
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+    
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self._refresh_entries()
+    
+    def _confirm(self, title, text, on_yes):
+        """Ask a Yes/No question without a nested event loop
+        
+        The box is window-modal via open(); on_yes() runs if Yes is clicked.
+        """
+        box = QMessageBox(QMessageBox.Question, title, text,
+                          QMessageBox.Yes | QMessageBox.No, self.main_window)
+        box.setDefaultButton(QMessageBox.No)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        
+        def on_clicked(button):
+            if box.standardButton(button) == QMessageBox.Yes:
+                on_yes()
+        
+        box.buttonClicked.connect(on_clicked)
+        box.open()
+    
+    def _ask_text(self, title, label, on_accepted, text="", echo=QLineEdit.Normal):
+        """Prompt for a line of text without a nested event loop
+        
+        on_accepted(text) runs when the dialog is accepted with OK.
+        """
+        dialog = QInputDialog(self.main_window)
+        dialog.setWindowTitle(title)
+        dialog.setLabelText(label)
+        dialog.setTextValue(text)
+        dialog.setTextEchoMode(echo)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.textValueSelected.connect(on_accepted)
+        dialog.open()
+    
+    @Slot()
+    @_gui_guard("Failed to create vault")
     def create_vault(self):
         """Create a new vault"""
-        try:
-            dialog = CreateVaultDialog(self.main_window)
-            dialog.vault_created.connect(self._handle_vault_created)
-            dialog.show_dialog()
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Failed to create vault: {e}")
+        dialog = CreateVaultDialog.get_instance(self.main_window)
+        dialog.reset()
+        dialog.vault_created.connect(self._handle_vault_created, Qt.UniqueConnection)
+        dialog.show_dialog()
     
+    @Slot(str, str, str)
     def _handle_vault_created(self, name, password, description):
         """Handle vault creation"""
+        self._run_vault_task(
+            "create vault",
+            lambda result: self._on_vault_create_finished(name, password, description),
+            self.vault_manager.create_vault, name, password, description
+        )
+    
+    def _on_vault_create_finished(self, name, password, description):
+        """Announce a vault created on the thread pool"""
+        self.vault_created.emit(name, password, description)
+        self.status_updated.emit(f"Vault '{name}' created successfully")
+    
+    def _run_vault_task(self, action, on_finished, fn, *args, on_error=None):
+        """Run a KDF-bound vault_manager call without blocking the event loop
+        
+        on_finished(result) runs on the GUI thread; failures go to
+        on_error(message), by default an error box saying "Failed to
+        <action>". Only one task runs at a time: a task started meanwhile
+        is queued behind it. The vault actions are disabled until the
+        queue is empty.
+        """
+        if self._task is not None:
+            self._queued_tasks.append((action, on_finished, fn, args, on_error))
+            return
+        
+        if on_error is None:
+            def on_error(message):
+                QMessageBox.critical(self.main_window, "Error", f"Failed to {action}: {message}")
+        
+        task = self._task = _VaultTask(fn, *args)
+        # Emitted on a pool thread; always queue back to the GUI thread
+        task.signals.finished.connect(
+            lambda result: self._on_vault_task_done(on_finished, result), Qt.QueuedConnection
+        )
+        task.signals.error.connect(
+            lambda message: self._on_vault_task_done(on_error, message), Qt.QueuedConnection
+        )
+        self._set_busy(True)
+        self.status_updated.emit(f"Working: {action}...")
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_vault_task_done(self, handler, value):
+        """Hand a task's outcome to handler and start the next task"""
+        # Hold the task until we return: dropping the last reference
+        # would delete the signals object that is still emitting
+        task, self._task = self._task, None
         try:
-            self.vault_manager.create_vault(name, password, description)
-            self.vault_created.emit(name, password, description)
-            self.status_updated.emit(f"Vault '{name}' created successfully")
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Failed to create vault: {e}")
+            handler(value)
+        finally:
+            # handler may have started a task itself
+            if self._task is None:
+                if self._queued_tasks:
+                    action, on_finished, fn, args, on_error = self._queued_tasks.popleft()
+                    self._run_vault_task(action, on_finished, fn, *args, on_error=on_error)
+                else:
+                    self._set_busy(False)
+    
+    def _set_busy(self, busy):
+        """Disable the toolbars and vault menu actions while tasks run"""
+        enabled = not busy
+        self.main_window.vault_toolbar.setEnabled(enabled)
+        self.main_window.entries_toolbar.setEnabled(enabled)
+        for action in self.main_window.task_actions:
+            action.setEnabled(enabled)
+    
+    def load_entries(self, on_loaded):
+        """Fetch the open vault's entries on the thread pool
+        
+        on_loaded(entries) runs on the GUI thread, unless a newer load was
+        started or the entries changed before the result arrived.
+        Failures are reported in the status bar.
+        """
+        self._on_entries_loaded = on_loaded
+        self._load_seq += 1
+        self._loads_pending += 1
+        seq = self._load_seq
+        self._run_vault_task(
+            "load entries",
+            lambda entries: self._on_load_done(seq, entries),
+            self.vault_manager.list_entries,
+            on_error=lambda message: self._on_load_failed(seq, message)
+        )
+    
+    def _on_load_done(self, seq, entries):
+        self._loads_pending -= 1
+        if seq == self._load_seq:
+            self._on_entries_loaded(entries)
+    
+    def _on_load_failed(self, seq, message):
+        self._loads_pending -= 1
+        if seq == self._load_seq:
+            self.status_updated.emit(f"Error refreshing entries: {message}")
     
+    def _entries_changed(self):
+        """Discard entry loads that started before a local change
+        
+        Their results would put back the entries as they were, so a new
+        load is scheduled instead.
+        """
+        if self._loads_pending:
+            self._load_seq += 1
+            self._schedule_refresh()
+    
+    @Slot()
+    @_gui_guard("Failed to delete vault")
     def delete_vault(self):
         """Delete the selected vault"""
-        try:
-            selected_item = self.main_window.vaults_manager.get_selected_item()
-            if not selected_item:
-                QMessageBox.warning(self.main_window, "Warning", "Please select a vault to delete")
-                return
-            
-            vault_name = selected_item.text(0)
-            
-            # Confirm deletion
-            reply = QMessageBox.question(
-                self.main_window, 
-                "Confirm Deletion", 
-                f"Are you sure you want to delete vault '{vault_name}'?\n\nThis action cannot be undone!",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            
-            if reply == QMessageBox.Yes:
-                self.vault_manager.delete_vault(vault_name)
-                self.main_window.refresh_vaults_list()
-                self.status_updated.emit(f"Vault '{vault_name}' deleted")
-                
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Failed to delete vault: {e}")
+        selected_values = self._vaults_mgr.get_selected_values()
+        if not selected_values:
+            QMessageBox.warning(self.main_window, "Warning", "Please select a vault to delete")
+            return
+        
+        vault_name = selected_values[0]
+        
+        # Confirm deletion
+        self._confirm(
+            "Confirm Deletion",
+            f"Are you sure you want to delete vault '{vault_name}'?\n\nThis action cannot be undone!",
+            lambda: self._continue_delete_vault(vault_name)
+        )
     
+    @_gui_guard("Failed to delete vault")
+    def _continue_delete_vault(self, vault_name):
+        """Delete a vault once the user has confirmed"""
+        self.vault_manager.delete_vault(vault_name)
+        self.main_window.refresh_vaults_list()
+        self.status_updated.emit(f"Vault '{vault_name}' deleted")
+    
+    @Slot()
+    @_gui_guard("Failed to rename vault")
     def rename_vault(self):
         """Rename the selected vault"""
-        try:
-            selected_item = self.main_window.vaults_manager.get_selected_item()
-            if not selected_item:
-                QMessageBox.warning(self.main_window, "Warning", "Please select a vault to rename")
-                return
-            
-            old_name = selected_item.text(0)
-            new_name, ok = QInputDialog.getText(
-                self.main_window, 
-                "Rename Vault", 
-                f"Enter new name for vault '{old_name}':",
-                text=old_name
-            )
-            
-            if ok and new_name.strip():
-                self.vault_manager.rename_vault(old_name, new_name.strip())
-                self.main_window.refresh_vaults_list()
-                self.status_updated.emit(f"Vault renamed to '{new_name}'")
-                
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Failed to rename vault: {e}")
+        selected_values = self._vaults_mgr.get_selected_values()
+        if not selected_values:
+            QMessageBox.warning(self.main_window, "Warning", "Please select a vault to rename")
+            return
+        
+        old_name = selected_values[0]
+        self._ask_text(
+            "Rename Vault",
+            f"Enter new name for vault '{old_name}':",
+            lambda new_name: self._continue_rename_vault(old_name, new_name),
+            text=old_name
+        )
+    
+    @_gui_guard("Failed to rename vault")
+    def _continue_rename_vault(self, old_name, new_name):
+        """Rename a vault once the user has entered the new name"""
+        new_name = new_name.strip()
+        if not new_name:
+            return
+        self.vault_manager.rename_vault(old_name, new_name)
+        self.main_window.refresh_vaults_list()
+        self.status_updated.emit(f"Vault renamed to '{new_name}'")
     
+    @Slot()
+    @_gui_guard("Failed to backup vault")
     def backup_vault(self):
         """Backup the selected vault"""
-        try:
-            selected_item = self.main_window.vaults_manager.get_selected_item()
-            if not selected_item:
-                QMessageBox.warning(self.main_window, "Warning", "Please select a vault to backup")
-                return
-            
-            vault_name = selected_item.text(0)
-            # TODO: Implement backup functionality
-            QMessageBox.information(self.main_window, "Info", f"Backup functionality for '{vault_name}' not yet implemented")
-            
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Failed to backup vault: {e}")
+        selected_values = self._vaults_mgr.get_selected_values()
+        if not selected_values:
+            QMessageBox.warning(self.main_window, "Warning", "Please select a vault to backup")
+            return
+        
+        vault_name = selected_values[0]
+        # TODO: Implement backup functionality
+        QMessageBox.information(self.main_window, "Info", f"Backup functionality for '{vault_name}' not yet implemented")
     
+    @Slot()
+    @_gui_guard("Failed to open vault")
     def open_vault(self, vault_name=None):
         """Open a vault"""
-        try:
-            if not vault_name:
-                selected_item = self.main_window.vaults_manager.get_selected_item()
-                if not selected_item:
-                    QMessageBox.warning(self.main_window, "Warning", "Please select a vault to open")
-                    return
-                vault_name = selected_item.text(0)
-            
-            # Get master password
-            password, ok = QInputDialog.getText(
-                self.main_window, 
-                "Open Vault", 
-                f"Enter master password for vault '{vault_name}':",
-                echo=QInputDialog.Password
+        if not vault_name:
+            selected_values = self._vaults_mgr.get_selected_values()
+            if not selected_values:
+                QMessageBox.warning(self.main_window, "Warning", "Please select a vault to open")
+                return
+            vault_name = selected_values[0]
+        
+        # Get master password
+        self._ask_text(
+            "Open Vault",
+            f"Enter master password for vault '{vault_name}':",
+            lambda password: self._continue_open_vault(vault_name, password),
+            echo=QLineEdit.Password
+        )
+    
+    def _continue_open_vault(self, vault_name, password):
+        """Unlock a vault once the user has entered its password"""
+        if password:
+            self._run_vault_task(
+                "open vault",
+                lambda result: self._on_vault_open_finished(vault_name),
+                self.vault_manager.open_vault, vault_name, password
             )
-            
-            if ok and password:
-                self.vault_manager.open_vault(vault_name, password)
-                self.current_vault = vault_name
-                self.vault_opened.emit(vault_name)
-                self.main_window.refresh_entries()
-                self.status_updated.emit(f"Vault '{vault_name}' opened successfully")
-                
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Failed to open vault: {e}")
     
+    def _on_vault_open_finished(self, vault_name):
+        """Show a vault unlocked on the thread pool"""
+        self.current_vault = vault_name
+        self.vault_opened.emit(vault_name)
+        self._schedule_refresh()
+        self.status_updated.emit(f"Vault '{vault_name}' opened successfully")
+    
+    @Slot()
+    @_gui_guard("Failed to close vault")
     def close_vault(self):
         """Close the current vault"""
-        try:
-            if self.current_vault:
-                self.vault_manager.close_vault()
-                self.current_vault = None
-                self.vault_closed.emit()
-                self.main_window.refresh_entries()
-                self.status_updated.emit("Vault closed")
-            else:
-                QMessageBox.information(self.main_window, "Info", "No vault is currently open")
-                
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Failed to close vault: {e}")
+        if self.current_vault:
+            self.vault_manager.close_vault()
+            self.current_vault = None
+            # Entries still loading belong to the closed vault
+            self._load_seq += 1
+            self.vault_closed.emit()
+            self._schedule_refresh()
+            self.status_updated.emit("Vault closed")
+        else:
+            QMessageBox.information(self.main_window, "Info", "No vault is currently open")
     
+    @Slot()
+    @_gui_guard("Failed to add entry")
     def add_entry(self):
         """Add a new entry to the current vault"""
-        try:
-            if not self.current_vault:
-                QMessageBox.warning(self.main_window, "Warning", "Please open a vault first")
-                return
-            
-            dialog = AddEntryDialog(self.main_window)
-            dialog.entry_added.connect(self._handle_entry_added)
-            dialog.show_dialog()
-            
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Failed to add entry: {e}")
+        if not self.current_vault:
+            QMessageBox.warning(self.main_window, "Warning", "Please open a vault first")
+            return
+        
+        dialog = AddEntryDialog.get_instance(self.main_window)
+        dialog.reset()
+        dialog.entry_added.connect(self._handle_entry_added, Qt.UniqueConnection)
+        dialog.show_dialog()
     
+    @Slot(dict)
+    @_gui_guard("Failed to add entry")
     def _handle_entry_added(self, entry_data):
         """Handle entry addition"""
-        try:
-            self.vault_manager.add_entry(entry_data)
-            self.entry_added.emit(entry_data)
-            self.main_window.refresh_entries()
-            self.status_updated.emit(f"Entry '{entry_data['name']}' added successfully")
-            
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Failed to add entry: {e}")
+        entry_id = self.vault_manager.add_entry(entry_data)
+        self._entries_changed()
+        self.entry_added.emit({**entry_data, "id": entry_id})
+        self.status_updated.emit(f"Entry '{entry_data['name']}' added successfully")
     
+    @Slot()
+    @_gui_guard("Failed to edit entry")
     def edit_entry(self):
         """Edit the selected entry"""
-        try:
-            if not self.current_vault:
-                QMessageBox.warning(self.main_window, "Warning", "Please open a vault first")
-                return
-            
-            selected_item = self.main_window.entries_manager.get_selected_item()
-            if not selected_item:
-                QMessageBox.warning(self.main_window, "Warning", "Please select an entry to edit")
-                return
-            
-            # Get entry data
-            entry_values = self.main_window.entries_manager.get_selected_values()
-            if not entry_values:
-                return
-            
-            # Find the entry in current entries
-            entry_data = None
-            for entry in self.current_entries:
-                if entry.get('name') == entry_values[0]:
-                    entry_data = entry
-                    break
-            
-            if not entry_data:
-                QMessageBox.warning(self.main_window, "Warning", "Entry not found")
-                return
-            
-            dialog = EditEntryDialog(entry_data, self.main_window)
-            dialog.entry_updated.connect(self._handle_entry_updated)
-            dialog.show_dialog()
-            
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Failed to edit entry: {e}")
+        if not self.current_vault:
+            QMessageBox.warning(self.main_window, "Warning", "Please open a vault first")
+            return
+        
+        if self._entries_mgr.get_selected_item() is None:
+            QMessageBox.warning(self.main_window, "Warning", "Please select an entry to edit")
+            return
+        
+        # Get entry data
+        entry_values = self._entries_mgr.get_selected_values()
+        if not entry_values:
+            return
+        
+        entry_data = self._entries_by_name.get(entry_values[0])
+        if not entry_data:
+            QMessageBox.warning(self.main_window, "Warning", "Entry not found")
+            return
+        
+        dialog = EditEntryDialog.get_instance(self.main_window, entry_data=entry_data)
+        dialog.reset(entry_data)
+        dialog.entry_updated.connect(self._handle_entry_updated, Qt.UniqueConnection)
+        dialog.show_dialog()
     
+    @Slot(dict)
+    @_gui_guard("Failed to update entry")
     def _handle_entry_updated(self, entry_data):
         """Handle entry update"""
-        try:
-            self.vault_manager.update_entry(entry_data['id'], entry_data)
-            self.entry_updated.emit(entry_data)
-            self.main_window.refresh_entries()
-            self.status_updated.emit(f"Entry '{entry_data['name']}' updated successfully")
-            
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Failed to update entry: {e}")
+        self.vault_manager.update_entry(entry_data['id'], entry_data)
+        self._entries_changed()
+        self.entry_updated.emit(entry_data)
+        self.status_updated.emit(f"Entry '{entry_data['name']}' updated successfully")
     
+    @Slot()
+    @_gui_guard("Failed to delete entry")
     def delete_entry(self):
         """Delete the selected entry"""
-        try:
-            if not self.current_vault:
-                QMessageBox.warning(self.main_window, "Warning", "Please open a vault first")
-                return
-            
-            selected_item = self.main_window.entries_manager.get_selected_item()
-            if not selected_item:
-                QMessageBox.warning(self.main_window, "Warning", "Please select an entry to delete")
-                return
-            
-            entry_values = self.main_window.entries_manager.get_selected_values()
-            if not entry_values:
-                return
-            
-            entry_name = entry_values[0]
-            
-            # Confirm deletion
-            reply = QMessageBox.question(
-                self.main_window, 
-                "Confirm Deletion", 
-                f"Are you sure you want to delete entry '{entry_name}'?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            
-            if reply == QMessageBox.Yes:
-                # Find entry ID
-                entry_id = None
-                for entry in self.current_entries:
-                    if entry.get('name') == entry_name:
-                        entry_id = entry.get('id')
-                        break
-                
-                if entry_id:
-                    self.vault_manager.delete_entry(entry_id)
-                    self.entry_deleted.emit(entry_id)
-                    self.main_window.refresh_entries()
-                    self.status_updated.emit(f"Entry '{entry_name}' deleted")
-                
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Failed to delete entry: {e}")
+        if not self.current_vault:
+            QMessageBox.warning(self.main_window, "Warning", "Please open a vault first")
+            return
+        
+        if self._entries_mgr.get_selected_item() is None:
+            QMessageBox.warning(self.main_window, "Warning", "Please select an entry to delete")
+            return
+        
+        entry_values = self._entries_mgr.get_selected_values()
+        if not entry_values:
+            return
+        
+        entry_name = entry_values[0]
+        
+        # Confirm deletion
+        self._confirm(
+            "Confirm Deletion",
+            f"Are you sure you want to delete entry '{entry_name}'?",
+            lambda: self._continue_delete_entry(entry_name)
+        )
+    
+    @_gui_guard("Failed to delete entry")
+    def _continue_delete_entry(self, entry_name):
+        """Delete an entry once the user has confirmed"""
+        entry = self._entries_by_name.get(entry_name)
+        entry_id = entry.get('id') if entry else None
+        
+        if entry_id:
+            self.vault_manager.delete_entry(entry_id)
+            self._entries_changed()
+            self.entry_deleted.emit(entry_id)
+            self.status_updated.emit(f"Entry '{entry_name}' deleted")
     
+    @Slot()
+    @_gui_guard("Failed to copy password")
     def copy_password(self):
         """Copy the selected entry's password to clipboard"""
-        try:
-            if not self.current_vault:
-                QMessageBox.warning(self.main_window, "Warning", "Please open a vault first")
-                return
-            
-            selected_item = self.main_window.entries_manager.get_selected_item()
-            if not selected_item:
-                QMessageBox.warning(self.main_window, "Warning", "Please select an entry")
-                return
-            
-            entry_values = self.main_window.entries_manager.get_selected_values()
-            if not entry_values:
-                return
-            
-            entry_name = entry_values[0]
-            
-            # Find the entry password
-            password = None
-            for entry in self.current_entries:
-                if entry.get('name') == entry_name:
-                    password = entry.get('password')
-                    break
-            
-            if password:
-                try:
-                    import pyperclip
-                    pyperclip.copy(password)
-                    self.password_copied.emit(password)
-                    self.status_updated.emit(f"Password for '{entry_name}' copied to clipboard")
-                except ImportError:
-                    QMessageBox.warning(self.main_window, "Error", "pyperclip not available for clipboard operations")
-            else:
-                QMessageBox.warning(self.main_window, "Warning", "No password found for this entry")
-                
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Failed to copy password: {e}")
+        if not self.current_vault:
+            QMessageBox.warning(self.main_window, "Warning", "Please open a vault first")
+            return
+        
+        if self._entries_mgr.get_selected_item() is None:
+            QMessageBox.warning(self.main_window, "Warning", "Please select an entry")
+            return
+        
+        entry_values = self._entries_mgr.get_selected_values()
+        if not entry_values:
+            return
+        
+        entry_name = entry_values[0]
+        
+        entry = self._entries_by_name.get(entry_name)
+        password = entry.get('password') if entry else None
+        
+        if password:
+            set_clipboard_text(password)
+            self.password_copied.emit(password)
+            self.status_updated.emit(f"Password for '{entry_name}' copied to clipboard")
+        else:
+            QMessageBox.warning(self.main_window, "Warning", "No password found for this entry")
     
+    @Slot()
+    @_gui_guard("Failed to generate password")
     def generate_password(self):
         """Generate a new password"""
-        try:
-            dialog = GeneratePasswordDialog(self.main_window)
-            dialog.password_generated.connect(self._handle_password_generated)
-            dialog.show_dialog()
-            
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Failed to generate password: {e}")
+        dialog = GeneratePasswordDialog.get_instance(self.main_window)
+        dialog.reset()
+        dialog.password_generated.connect(self._handle_password_generated, Qt.UniqueConnection)
+        dialog.show_dialog()
     
+    @Slot(str)
+    @_gui_guard("Failed to copy password")
     def _handle_password_generated(self, password):
         """Handle password generation"""
-        try:
-            # Copy to clipboard
-            import pyperclip
-            pyperclip.copy(password)
-            self.password_copied.emit(password)
-            self.status_updated.emit("Generated password copied to clipboard")
-            
-        except ImportError:
-            QMessageBox.warning(self.main_window, "Error", "pyperclip not available for clipboard operations")
+        set_clipboard_text(password)
+        self.password_copied.emit(password)
+        self.status_updated.emit("Generated password copied to clipboard")
     
+    @Slot(str)
+    @_gui_guard("Search failed")
     def on_search_change(self, search_text):
-        """Handle search text changes"""
-        try:
-            self.main_window.filter_entries(search_text)
-            self.status_updated.emit(f"Searching for: {search_text}")
-            
-        except Exception as e:
-            QMessageBox.critical(self.main_window, "Error", f"Search failed: {e}")
+        """Handle search text changes
+        
+        SearchBox already debounces textChanged, so this runs once per
+        pause in typing; filter_entries reports the match count.
+        """
+        self.main_window.filter_entries(search_text)
     
+    @Slot()
     def on_vault_select(self):
         """Handle vault selection"""
         try:
-            selected_item = self.main_window.vaults_manager.get_selected_item()
-            if selected_item:
-                vault_name = selected_item.text(0)
+            selected_values = self._vaults_mgr.get_selected_values()
+            if selected_values:
+                vault_name = selected_values[0]
                 self.status_updated.emit(f"Selected vault: {vault_name}")
                 
         except Exception as e:
             self.status_updated.emit(f"Selection error: {e}")
     
+    @Slot()
     def on_vault_double_click(self):
         """Handle vault double-click (open vault)"""
-        self.open_vault()
+        if self._task is None:
+            self.open_vault()
     
+    @Slot()
     def on_entry_double_click(self):
         """Handle entry double-click (edit entry)"""
-        self.edit_entry()
+        if self._task is None:
+            self.edit_entry()
     
     def on_key_press(self, event):
         """Handle keyboard shortcuts"""
         try:
-            # Ctrl+N: New entry
-            if event.key() == ord('N') and event.modifiers() == Qt.ControlModifier:
-                self.add_entry()
-            
-            # Ctrl+E: Edit entry
-            elif event.key() == ord('E') and event.modifiers() == Qt.ControlModifier:
-                self.edit_entry()
-            
-            # Delete: Delete entry
-            elif event.key() == Qt.Key_Delete:
-                self.delete_entry()
-            
-            # Ctrl+C: Copy password
-            elif event.key() == ord('C') and event.modifiers() == Qt.ControlModifier:
-                self.copy_password()
-            
-            # Ctrl+G: Generate password
-            elif event.key() == ord('G') and event.modifiers() == Qt.ControlModifier:
-                self.generate_password()
+            handler = self._KEY_SHORTCUTS.get((event.key(), event.modifiers()))
+            # Like the disabled menu actions, shortcuts wait for vault tasks
+            if handler and self._task is None:
+                getattr(self, handler)()
                 
         except Exception as e:
             self.status_updated.emit(f"Keyboard shortcut error: {e}")
     
     def set_current_entries(self, entries):
-        """Set the current entries list"""
-        self.current_entries = entries 
\ No newline at end of file
+        """Set the current entries list and index it by name and id"""
+        self.current_entries = entries
+        # Built back to front so the first entry with a duplicate name wins,
+        # as the old linear search did
+        self._entries_by_name = {e.get('name'): e for e in reversed(entries)}
+        self._entries_by_id = {e.get('id'): e for e in reversed(entries)} 
\ No newline at end of file
@@ -6,17 +6,76 @@ Modular version with separated components
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
+import functools
+import queue
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from pm_core.vault_manager import VaultManager
 from pm_core.utils import clipboard_handler
 
-from .dialogs import CreateVaultDialog, AddEntryDialog, EditEntryDialog, GeneratePasswordDialog
+from .dialogs import CreateVaultDialog, EntryDialog, GeneratePasswordDialog
 from .components import SearchBox, StatusBar, ToolBar, TreeViewManager
 from .events import EventHandler
 
+# Rows added to entries_tree at a time; more are added as the list is
+# scrolled towards its end
+ENTRY_PAGE_SIZE = 200
+
+# Search terms whose results filter_entries remembers
+FILTER_CACHE_SIZE = 64
+
+# Above this many rows, entries_tree is rebuilt rather than cleared
+TREE_REBUILD_ROWS = 1000
+
+# How often the Tk thread checks for finished background calls while
+# any are outstanding
+RESULT_POLL_MS = 20
+
+
+def _term_matcher(search_term):
+    """Predicate telling whether a search text contains every word of search_term"""
+    words = tuple(sorted(set(search_term.split())))
+    if len(words) <= 1:
+        word = words[0] if words else ""
+        return lambda text: word in text
+    return _keywords_matcher(words)
+
+
+@functools.lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _keywords_matcher(words):
+    """Predicate for several words, one pass per text with pyahocorasick if installed"""
+    if ahocorasick is None:
+        return lambda text: all(word in text for word in words)
+    
+    automaton = ahocorasick.Automaton()
+    for i, word in enumerate(words):
+        automaton.add_word(word, 1 << i)
+    automaton.make_automaton()
+    all_found = (1 << len(words)) - 1
+    
+    def matches(text):
+        found = 0
+        for end, bit in automaton.iter(text):
+            found |= bit
+            if found == all_found:
+                return True
+        return False
+    return matches
+
+
+@functools.lru_cache(maxsize=None)
+def _password_mask(length):
+    """Asterisks standing in for a password of this length"""
+    return "*" * length
+
 
 class MultiVaultPasswordManagerGUI:
     """Main GUI application with modular components"""
@@ -30,6 +89,39 @@ class MultiVaultPasswordManagerGUI:
         self.vault_manager = VaultManager()
         self.current_vault = None
         self.current_entries = []
+        # Entry per id, kept in step with current_entries
+        self._entries_by_id = {}
+        # Column values per entry id, filled as rows are first shown
+        self._row_cache = {}
+        # Casefolded search text per entry, parallel to current_entries
+        self._search_index = []
+        # Search term -> positions in current_entries that match it, most
+        # recently used last; emptied whenever current_entries changes
+        self._filter_cache = OrderedDict()
+        # Vault name per vaults_tree item id, rebuilt by refresh_vaults_list
+        self.vault_names = {}
+        # get_vault_info() result per vault name, fetched when a vault is
+        # first selected; emptied by refresh_vaults_list
+        self._vault_info_cache = {}
+        # Entry id per entries_tree item id, kept in step with the rows shown
+        self.entry_ids = {}
+        # Entries matching the current search, in display order; only the
+        # first _rendered of them have rows in entries_tree so far
+        self._shown = []
+        self._rendered = 0
+        # Runs blocking vault_manager calls (disk, KDF, decryption) off the
+        # Tk thread. One worker, since VaultManager isn't thread-safe and
+        # calls must finish in the order they were made.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Finished calls as (future, on_done, on_error), put there by the
+        # worker and taken off by _poll_results on the Tk thread; Tk itself
+        # may only be called from the Tk thread
+        self._results = queue.Queue()
+        self._outstanding = 0
+        self._poll_id = None
+        # Number of the latest "vaults" / "entries" refresh; results of
+        # older ones are dropped when they arrive
+        self._refresh_seq = {"vaults": 0, "entries": 0}
         
         # Initialize event handler
         self.event_handler = EventHandler(self)
@@ -143,15 +235,26 @@ class MultiVaultPasswordManagerGUI:
         self.search_box.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
         
         # Entries list
-        entries_list_frame = ttk.Frame(entries_frame)
-        entries_list_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        entries_list_frame.columnconfigure(0, weight=1)
-        entries_list_frame.rowconfigure(0, weight=1)
+        self.entries_list_frame = ttk.Frame(entries_frame)
+        self.entries_list_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.entries_list_frame.columnconfigure(0, weight=1)
+        self.entries_list_frame.rowconfigure(0, weight=1)
+        
+        # Scrollbar for entries
+        self.entries_scrollbar = ttk.Scrollbar(self.entries_list_frame, orient=tk.VERTICAL)
+        self.entries_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
         # Treeview for entries
+        self._build_entries_tree()
+        
+        # Initialize entries tree manager
+        self.entries_manager = TreeViewManager(self.entries_tree)
+        
+    def _build_entries_tree(self):
+        """Create entries_tree in entries_list_frame and hook up its scrollbar"""
         entry_columns = ("Title", "Username", "URL", "Notes")
         self.entries_tree = ttk.Treeview(
-            entries_list_frame, columns=entry_columns, show="headings", height=15
+            self.entries_list_frame, columns=entry_columns, show="headings", height=15
         )
         
         # Configure columns
@@ -159,17 +262,26 @@ class MultiVaultPasswordManagerGUI:
             self.entries_tree.heading(col, text=col)
             self.entries_tree.column(col, width=150)
         
-        # Scrollbar for entries
-        entries_scrollbar = ttk.Scrollbar(entries_list_frame, orient=tk.VERTICAL, 
-                                        command=self.entries_tree.yview)
-        self.entries_tree.configure(yscrollcommand=entries_scrollbar.set)
-        
-        # Pack entries treeview
+        self.entries_scrollbar.configure(command=self.entries_tree.yview)
+        self.entries_tree.configure(yscrollcommand=self._on_entries_scroll)
         self.entries_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        entries_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
-        # Initialize entries tree manager
-        self.entries_manager = TreeViewManager(self.entries_tree)
+    def _bind_entries_tree(self):
+        """Bind the entries_tree events"""
+        self.entries_tree.bind("<<TreeviewSelect>>", self.event_handler.on_entry_select)
+        self.entries_tree.bind("<Double-1>", self.event_handler.on_entry_double_click)
+        
+    def _recreate_entries_tree(self):
+        """Replace entries_tree with an empty one
+        
+        Destroying a large tree frees all of its items at once, which is
+        cheaper than deleting them.
+        """
+        self.entries_tree.destroy()
+        self._build_entries_tree()
+        self._bind_entries_tree()
+        self.entries_manager.treeview = self.entries_tree
+        self.entry_ids = {}
         
     def setup_status_bar(self):
         """Setup the status bar"""
@@ -183,134 +295,382 @@ class MultiVaultPasswordManagerGUI:
         self.vaults_tree.bind("<Double-1>", self.event_handler.on_vault_double_click)
         
         # Entries tree bindings
-        self.entries_tree.bind("<Double-1>", self.event_handler.on_entry_double_click)
+        self._bind_entries_tree()
         
         # Keyboard shortcuts
         self.root.bind("<Key>", self.event_handler.on_key_press)
         
-    def refresh_vaults_list(self):
-        """Refresh the vaults list"""
-        try:
-            self.status_bar.set_status("Refreshing vaults...")
-            self.status_bar.show_progress()
+    def run_in_background(self, fn, on_done, on_error, *args):
+        """Call fn(*args) on the worker thread
+        
+        on_done(result) or on_error(exception) is then run on the Tk thread,
+        which is the only place widgets and current_entries are touched.
+        """
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(lambda f: self._results.put((f, on_done, on_error)))
+        self._outstanding += 1
+        if self._poll_id is None:
+            self._poll_id = self.root.after(RESULT_POLL_MS, self._poll_results)
             
-            # Clear existing items
-            self.vaults_manager.clear()
+    def _poll_results(self):
+        """Deliver finished background calls, in the order they finished"""
+        self._poll_id = None
+        try:
+            while True:
+                try:
+                    future, on_done, on_error = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                self._outstanding -= 1
+                self._deliver(future, on_done, on_error)
+        finally:
+            # A callback may have started another call, and with it a poll
+            if self._outstanding and self._poll_id is None:
+                self._poll_id = self.root.after(RESULT_POLL_MS, self._poll_results)
+        
+    @staticmethod
+    def _deliver(future, on_done, on_error):
+        error = future.exception()
+        if error is not None:
+            on_error(error)
+        else:
+            on_done(future.result())
             
-            # Get vaults from manager
-            vaults = self.vault_manager.list_vaults()
+    def refresh_vaults_list(self):
+        """Refresh the vaults list"""
+        self.status_bar.set_status("Refreshing vaults...")
+        self.status_bar.show_progress()
+        self._vault_info_cache.clear()
+        seq = self._next_refresh("vaults")
+        self.run_in_background(
+            self.vault_manager.list_vaults,
+            lambda vaults: self._apply_vaults(seq, vaults),
+            self._refresh_failed("vaults", seq)
+        )
+        
+    def _apply_vaults(self, seq, vaults):
+        """Show the listed vaults; details are loaded by load_vault_info"""
+        if seq != self._refresh_seq["vaults"]:
+            return
+        items = self.vaults_manager.replace_items(
+            (self._vault_values(vault, None), None) for vault in vaults
+        )
+        self.vault_names = dict(zip(items, vaults))
             
-            # Add vaults to treeview
-            for vault in vaults:
-                vault_info = self.vault_manager.get_vault_info(vault)
-                values = (
-                    vault,
-                    vault_info.get("status", "Closed"),
-                    vault_info.get("entry_count", 0),
-                    vault_info.get("created", ""),
-                    vault_info.get("last_accessed", "")
-                )
-                self.vaults_manager.add_item(values)
+        self.status_bar.hide_progress()
+        self.status_bar.set_status(f"Found {len(vaults)} vaults")
+        
+    @staticmethod
+    def _vault_values(vault, vault_info):
+        """Column values for a vault, with placeholders until its info is loaded"""
+        if vault_info is None:
+            return (vault, "—", "—", "—", "—")
+        return (
+            vault,
+            vault_info.get("status", "Closed"),
+            vault_info.get("entry_count", 0),
+            vault_info.get("created", ""),
+            vault_info.get("last_accessed", "")
+        )
+        
+    def load_vault_info(self, item):
+        """Fill in a vault row's details the first time it is selected"""
+        vault = self.vault_names.get(item)
+        if vault is None or vault in self._vault_info_cache:
+            return
+        # Claimed now so repeated selections don't queue the same lookup
+        self._vault_info_cache[vault] = None
+        
+        def on_done(vault_info):
+            self._vault_info_cache[vault] = vault_info
+            # The list may have been refreshed in the meantime
+            if self.vault_names.get(item) == vault:
+                self.vaults_tree.item(item, values=self._vault_values(vault, vault_info))
                 
-            self.status_bar.hide_progress()
-            self.status_bar.set_status(f"Found {len(vaults)} vaults")
+        def on_error(e):
+            self._vault_info_cache.pop(vault, None)
+            self.status_bar.set_status(f"Error loading vault info: {e}")
             
-        except Exception as e:
+        self.run_in_background(self.vault_manager.get_vault_info, on_done, on_error, vault)
+        
+    def _next_refresh(self, what):
+        """Start a new "vaults" or "entries" refresh and return its number"""
+        self._refresh_seq[what] += 1
+        return self._refresh_seq[what]
+        
+    def _refresh_failed(self, what, seq):
+        """Error callback for a background refresh"""
+        def on_error(e):
+            if seq != self._refresh_seq[what]:
+                return
             self.status_bar.hide_progress()
-            self.status_bar.set_status(f"Error refreshing vaults: {e}")
+            self.status_bar.set_status(f"Error refreshing {what}: {e}")
+        return on_error
+            
+    def set_current_vault(self, vault_name):
+        """Switch to another vault, dropping everything held for the old one"""
+        if vault_name != self.current_vault:
+            self.current_vault = vault_name
+            self._reset_entry_state()
             
+    def _reset_entry_state(self):
+        """Empty the entries list and every cache built from it"""
+        self.entries_manager.clear()
+        self.entry_ids = {}
+        self.event_handler.clear_entry_selection()
+        self.current_entries = []
+        self._entries_by_id = {}
+        self._search_index = []
+        self._row_cache.clear()
+        self._filter_cache.clear()
+        self._shown = []
+        self._rendered = 0
+        
     def refresh_entries(self):
         """Refresh the entries list"""
         if not self.current_vault:
             return
             
-        try:
-            self.status_bar.set_status("Refreshing entries...")
-            self.status_bar.show_progress()
+        self.status_bar.set_status("Refreshing entries...")
+        self.status_bar.show_progress()
+        vault = self.current_vault
+        seq = self._next_refresh("entries")
+        self.run_in_background(
+            self.vault_manager.list_entries,
+            lambda entries: self._apply_entries(seq, vault, entries),
+            self._refresh_failed("entries", seq),
+            vault
+        )
+        
+    def _apply_entries(self, seq, vault, entries):
+        """Show the entries loaded for vault"""
+        # A newer refresh was started, or another vault selected, while
+        # these were loading
+        if seq != self._refresh_seq["entries"] or vault != self.current_vault:
+            return
+        self.status_bar.hide_progress()
             
-            # Clear existing items
-            self.entries_manager.clear()
+        self.current_entries = entries
+        self._entries_by_id = {entry.get("id"): entry for entry in reversed(entries)}
+        self._row_cache.clear()
+        search_text = self._search_text
+        self._search_index = [search_text(entry) for entry in entries]
+        self._filter_cache.clear()
+        self._show_entries(entries)
+        
+        self.status_bar.set_status(f"Found {len(entries)} entries in {vault}")
+            
+    @staticmethod
+    def _entry_values(entry):
+        """Column values shown for an entry in entries_tree"""
+        get = entry.get
+        notes = get("notes", "")
+        return (
+            get("title", ""),
+            get("username", ""),
+            get("url", ""),
+            notes[:50] + "..." if len(notes) > 50 else notes
+        )
+        
+    def _row_values(self, entry):
+        """Column values for an entry, computed once per entry"""
+        entry_id = entry.get("id")
+        values = self._row_cache.get(entry_id)
+        if values is None:
+            values = self._row_cache[entry_id] = self._entry_values(entry)
+        return values
+        
+    def _entry_index(self, entry_id):
+        """Position of an entry in current_entries, or None"""
+        for i, entry in enumerate(self.current_entries):
+            if entry.get("id") == entry_id:
+                return i
+        return None
+        
+    def _show_entries(self, entries):
+        """Replace the rows of entries_tree with the first page of entries"""
+        self._shown = list(entries)
+        page = entries[:ENTRY_PAGE_SIZE]
+        ids, rows = self._page_rows(page)
+        if len(self.entry_ids) > TREE_REBUILD_ROWS:
+            self._recreate_entries_tree()
+        self.entry_ids = dict(zip(self.entries_manager.replace_items(rows), ids))
+        self._rendered = len(page)
+        # The old rows and their selection are gone, and a recreated tree
+        # hands out the same item ids again for different entries
+        self.entries_tree.selection_set(())
+        self.event_handler.clear_entry_selection()
+        
+    def _page_rows(self, page):
+        """Entry ids and (values, tags) rows for a page of entries"""
+        ids = [entry.get("id") for entry in page]
+        row_values = self._row_values
+        return ids, [(row_values(entry), (entry_id,)) for entry, entry_id in zip(page, ids)]
+        
+    def _on_entries_scroll(self, first, last):
+        """Track the scrollbar and add the next page near the end of the list"""
+        self.entries_scrollbar.set(first, last)
+        if float(last) >= 0.9 and self._rendered < len(self._shown):
+            page = self._shown[self._rendered:self._rendered + ENTRY_PAGE_SIZE]
+            ids, rows = self._page_rows(page)
+            self.entry_ids.update(zip(self.entries_manager.add_items(rows), ids))
+            self._rendered += len(page)
             
-            # Get entries from current vault
-            entries = self.vault_manager.list_entries(self.current_vault)
-            self.current_entries = entries
+    def _shown_index(self, entry_id):
+        """Position of an entry in _shown, or None"""
+        for i, entry in enumerate(self._shown):
+            if entry.get("id") == entry_id:
+                return i
+        return None
+        
+    def _add_entry_row(self, entry):
+        """Append a row for an entry to entries_tree"""
+        entry_id = entry.get("id")
+        item = self.entries_manager.add_item(self._row_values(entry), tags=(entry_id,))
+        self.entry_ids[item] = entry_id
+        
+    def insert_entry_row(self, entry):
+        """Add one new entry without rebuilding the entries list"""
+        text = self._search_text(entry)
+        self.current_entries.append(entry)
+        self._entries_by_id.setdefault(entry.get("id"), entry)
+        self._search_index.append(text)
+        self._filter_cache.clear()
+        # Only show it if it matches the active search
+        if _term_matcher(self.search_box.get_value().casefold())(text):
+            self._shown.append(entry)
+            # Otherwise it is added with its page when the list is scrolled
+            if self._rendered == len(self._shown) - 1:
+                self._add_entry_row(entry)
+                self._rendered += 1
             
-            # Add entries to treeview
-            for entry in entries:
-                values = (
-                    entry.get("title", ""),
-                    entry.get("username", ""),
-                    entry.get("url", ""),
-                    entry.get("notes", "")[:50] + "..." if len(entry.get("notes", "")) > 50 else entry.get("notes", "")
-                )
-                self.entries_manager.add_item(values, tags=(entry.get("id"),))
-                
-            self.status_bar.hide_progress()
-            self.status_bar.set_status(f"Found {len(entries)} entries in {self.current_vault}")
+    def update_entry_row(self, item, entry):
+        """Redraw one edited entry in place"""
+        self._row_cache.pop(entry.get("id"), None)
+        i = self._entry_index(entry.get("id"))
+        if i is not None:
+            self.current_entries[i] = entry
+            self._entries_by_id[entry.get("id")] = entry
+            self._search_index[i] = self._search_text(entry)
+            self._filter_cache.clear()
+        i = self._shown_index(entry.get("id"))
+        if i is not None:
+            self._shown[i] = entry
+        item = self._entry_row_item(item, entry.get("id"))
+        if item is not None:
+            self.entries_tree.item(item, values=self._row_values(entry))
             
-        except Exception as e:
-            self.status_bar.hide_progress()
-            self.status_bar.set_status(f"Error refreshing entries: {e}")
+    def delete_entry_row(self, item, entry_id):
+        """Drop one deleted entry from the list"""
+        i = self._entry_index(entry_id)
+        if i is not None:
+            del self.current_entries[i]
+            self._entries_by_id.pop(entry_id, None)
+            self._row_cache.pop(entry_id, None)
+            del self._search_index[i]
+            self._filter_cache.clear()
+        i = self._shown_index(entry_id)
+        if i is not None:
+            del self._shown[i]
+            if i < self._rendered:
+                self._rendered -= 1
+        item = self._entry_row_item(item, entry_id)
+        if item is not None:
+            del self.entry_ids[item]
+            self.entries_tree.delete(item)
             
+    def _entry_row_item(self, item, entry_id):
+        """Current tree item showing entry_id, or None if it isn't shown
+        
+        item is the id the caller saw earlier; the rows may have been
+        rebuilt since, and a rebuilt tree reuses item ids for other entries.
+        """
+        if self.entry_ids.get(item) == entry_id:
+            return item
+        for other, other_id in self.entry_ids.items():
+            if other_id == entry_id:
+                return other
+        return None
+            
+    @staticmethod
+    def _search_text(entry):
+        """Searchable fields of an entry, casefolded and joined once
+        
+        The unit separator keeps a term from matching across two fields.
+        """
+        get = entry.get
+        return "\x1f".join((
+            get("title", ""),
+            get("username", ""),
+            get("url", ""),
+            get("notes", ""),
+        )).casefold()
+        
     def filter_entries(self, search_term):
         """Filter entries based on search term"""
         if not self.current_vault:
             return
             
         try:
-            # Clear existing items
-            self.entries_manager.clear()
-            
-            # Filter entries
-            filtered_entries = []
-            for entry in self.current_entries:
-                if (search_term in entry.get("title", "").lower() or
-                    search_term in entry.get("username", "").lower() or
-                    search_term in entry.get("url", "").lower() or
-                    search_term in entry.get("notes", "").lower()):
-                    filtered_entries.append(entry)
-            
-            # Add filtered entries to treeview
-            for entry in filtered_entries:
-                values = (
-                    entry.get("title", ""),
-                    entry.get("username", ""),
-                    entry.get("url", ""),
-                    entry.get("notes", "")[:50] + "..." if len(entry.get("notes", "")) > 50 else entry.get("notes", "")
-                )
-                self.entries_manager.add_item(values, tags=(entry.get("id"),))
+            entries = self.current_entries
+            filtered_entries = [entries[i] for i in self._matching_positions(search_term)]
+            self._show_entries(filtered_entries)
                 
             self.status_bar.set_status(f"Found {len(filtered_entries)} matching entries")
             
         except Exception as e:
             self.status_bar.set_status(f"Error filtering entries: {e}")
             
-    def get_selected_entry_data(self):
-        """Get data for the currently selected entry"""
-        selection = self.entries_tree.selection()
-        if not selection:
-            return None
+    def _matching_positions(self, search_term):
+        """Positions in current_entries whose search text contains every
+        word of search_term
+        
+        Results are cached per term. A term that extends a cached one only
+        rescans that term's matches, so typing further narrows the last
+        result instead of going over every entry again.
+        """
+        cache = self._filter_cache
+        positions = cache.get(search_term)
+        if positions is not None:
+            cache.move_to_end(search_term)
+            return positions
             
-        item_id = selection[0]
-        tags = self.entries_tree.item(item_id)["tags"]
-        
-        if tags and self.current_entries:
-            entry_id = tags[0]
-            for entry in self.current_entries:
-                if entry.get("id") == entry_id:
-                    return entry
-                    
-        return None
+        # Longest cached term contained in this one; its matches are a superset
+        base = max((term for term in cache if term in search_term), key=len, default=None)
+        candidates = cache[base] if base is not None else range(len(self._search_index))
+        index = self._search_index
+        matches = _term_matcher(search_term)
+        positions = [i for i in candidates if matches(index[i])]
+        
+        cache[search_term] = positions
+        if len(cache) > FILTER_CACHE_SIZE:
+            cache.popitem(last=False)
+        return positions
+        
+    def get_selected_entry_data(self, item=None):
+        """Get data for the selected entry, or for the given tree item"""
+        if item is None:
+            selection = self.entries_tree.selection()
+            if not selection:
+                return None
+            item = selection[0]
+            
+        return self._entries_by_id.get(self.entry_ids.get(item))
         
     def open_vault(self, vault_name):
         """Open a vault"""
-        try:
-            self.vault_manager.open_vault(vault_name)
-            self.current_vault = vault_name
-            self.refresh_entries()
-            self.status_bar.set_status(f"Opened vault: {vault_name}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to open vault: {e}")
+        self.status_bar.set_status(f"Opening vault: {vault_name}...")
+        self.run_in_background(
+            self.vault_manager.open_vault,
+            lambda result: self._vault_opened(vault_name),
+            lambda e: messagebox.showerror("Error", f"Failed to open vault: {e}"),
+            vault_name
+        )
+        
+    def _vault_opened(self, vault_name):
+        self.set_current_vault(vault_name)
+        self.refresh_entries()
+        self.status_bar.set_status(f"Opened vault: {vault_name}")
             
     def save_vault(self):
         """Save the current vault"""
@@ -318,11 +678,14 @@ class MultiVaultPasswordManagerGUI:
             messagebox.showwarning("Warning", "No vault selected")
             return
             
-        try:
-            self.vault_manager.save_vault(self.current_vault)
-            self.status_bar.set_status(f"Saved vault: {self.current_vault}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save vault: {e}")
+        vault = self.current_vault
+        self.status_bar.set_status(f"Saving vault: {vault}...")
+        self.run_in_background(
+            self.vault_manager.save_vault,
+            lambda result: self.status_bar.set_status(f"Saved vault: {vault}"),
+            lambda e: messagebox.showerror("Error", f"Failed to save vault: {e}"),
+            vault
+        )
             
     def view_entry(self):
         """View entry details"""
@@ -331,13 +694,14 @@ class MultiVaultPasswordManagerGUI:
             messagebox.showwarning("Warning", "Please select an entry to view")
             return
             
-        details = f"""
-Title: {entry_data.get('title', '')}
-Username: {entry_data.get('username', '')}
-Password: {'*' * len(entry_data.get('password', ''))}
-URL: {entry_data.get('url', '')}
-Notes: {entry_data.get('notes', '')}
-        """
+        get = entry_data.get
+        details = (
+            f"\nTitle: {get('title', '')}\n"
+            f"Username: {get('username', '')}\n"
+            f"Password: {_password_mask(len(get('password') or ''))}\n"
+            f"URL: {get('url', '')}\n"
+            f"Notes: {get('notes', '')}"
+        )
         
         messagebox.showinfo("Entry Details", details)
 
@@ -347,6 +711,7 @@ def main():
     root = tk.Tk()
     app = MultiVaultPasswordManagerGUI(root)
     root.mainloop()
+    app._executor.shutdown(wait=False)
 
 
 if __name__ == "__main__":
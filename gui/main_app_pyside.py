@@ -9,23 +9,29 @@ from pathlib import Path
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QSplitter, QTreeWidget, QTreeWidgetItem, QLabel, QGroupBox, QFrame,
+    QSplitter, QTreeView, QLabel, QGroupBox, QFrame,
     QMenuBar, QMenu, QMessageBox, QApplication
 )
 from PySide6.QtGui import QAction
-from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtCore import Qt, Signal, Slot, QTimer
 from PySide6.QtGui import QFont, QIcon, QKeySequence
 
 # Add the project root to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from pm_core.vault_manager import VaultManager
-from pm_core.utils import clipboard_handler
 
-from .components_pyside import SearchBox, StatusBar, ToolBar, TreeViewManager
+from .components_pyside import (
+    SearchBox, StatusBar, ToolBar, TreeViewManager, load_stylesheet
+)
 from .events_pyside import EventHandler
 
 
+def _truncate(text, length):
+    """text cut to length characters, with "..." appended if it was longer"""
+    return text if len(text) <= length else text[:length] + "..."
+
+
 class MultiVaultPasswordManagerGUI(QMainWindow):
     """Main application window for the password manager"""
     
@@ -35,6 +41,9 @@ class MultiVaultPasswordManagerGUI(QMainWindow):
         self.current_vault = None
         self.current_entries = []
         self.filtered_entries = []
+        # Lowercased search text per entry id, and the current search term
+        self._haystacks = {}
+        self._search_lower = ""
         
         # Create event handler first
         self.event_handler = EventHandler(self)
@@ -42,7 +51,6 @@ class MultiVaultPasswordManagerGUI(QMainWindow):
         # Setup UI components
         self.setup_ui()
         self.setup_menu()
-        self.setup_styling()
         
         # Connect signals after UI is created
         self.connect_signals()
@@ -96,14 +104,15 @@ class MultiVaultPasswordManagerGUI(QMainWindow):
         vaults_layout.addWidget(self.vault_toolbar)
         
         # Vaults tree
-        self.vaults_tree = QTreeWidget()
-        self.vaults_tree.setHeaderLabels(["Name", "Status", "Entries", "Created", "Last Accessed"])
+        self.vaults_tree = QTreeView()
         self.vaults_tree.setAlternatingRowColors(True)
-        self.vaults_tree.setSortingEnabled(True)
         vaults_layout.addWidget(self.vaults_tree)
         
         # Initialize vaults manager
-        self.vaults_manager = TreeViewManager(self.vaults_tree)
+        self.vaults_manager = TreeViewManager(
+            self.vaults_tree, ["Name", "Status", "Entries", "Created", "Last Accessed"]
+        )
+        self.vaults_tree.setSortingEnabled(True)
         
         # Add to splitter
         self.splitter.addWidget(vaults_group)
@@ -130,14 +139,15 @@ class MultiVaultPasswordManagerGUI(QMainWindow):
         entries_layout.addWidget(self.search_box)
         
         # Entries tree
-        self.entries_tree = QTreeWidget()
-        self.entries_tree.setHeaderLabels(["Title", "Username", "URL", "Notes"])
+        self.entries_tree = QTreeView()
         self.entries_tree.setAlternatingRowColors(True)
-        self.entries_tree.setSortingEnabled(True)
         entries_layout.addWidget(self.entries_tree)
         
         # Initialize entries manager
-        self.entries_manager = TreeViewManager(self.entries_tree)
+        self.entries_manager = TreeViewManager(
+            self.entries_tree, ["Title", "Username", "URL", "Notes"]
+        )
+        self.entries_tree.setSortingEnabled(True)
         
         # Add to splitter
         self.splitter.addWidget(entries_group)
@@ -149,10 +159,12 @@ class MultiVaultPasswordManagerGUI(QMainWindow):
     
     def connect_signals(self):
         """Connect signals after UI is created"""
+        self.event_handler.bind_views()
+        
         # Connect tree view signals
-        self.vaults_tree.itemSelectionChanged.connect(self.event_handler.on_vault_select)
-        self.vaults_tree.itemDoubleClicked.connect(self.event_handler.on_vault_double_click)
-        self.entries_tree.itemDoubleClicked.connect(self.event_handler.on_entry_double_click)
+        self.vaults_tree.selectionModel().selectionChanged.connect(self.event_handler.on_vault_select)
+        self.vaults_tree.doubleClicked.connect(self.event_handler.on_vault_double_click)
+        self.entries_tree.doubleClicked.connect(self.event_handler.on_entry_double_click)
     
     def setup_menu(self):
         """Setup the menu bar"""
@@ -213,6 +225,13 @@ class MultiVaultPasswordManagerGUI(QMainWindow):
         generate_password_action.triggered.connect(self.event_handler.generate_password)
         edit_menu.addAction(generate_password_action)
         
+        # Disabled by the event handler while vault tasks run
+        self.task_actions = [
+            new_vault_action, open_vault_action, close_vault_action,
+            add_entry_action, edit_entry_action, delete_entry_action,
+            copy_password_action, generate_password_action,
+        ]
+        
         # Help menu
         help_menu = menubar.addMenu("&Help")
         
@@ -220,78 +239,34 @@ class MultiVaultPasswordManagerGUI(QMainWindow):
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
     
-    def setup_styling(self):
-        """Setup modern styling"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e1e;
-                color: white;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #555555;
-                border-radius: 6px;
-                margin-top: 6px;
-                padding-top: 10px;
-                color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: white;
-            }
-            QMenuBar {
-                background-color: #2b2b2b;
-                color: white;
-                border-bottom: 1px solid #555555;
-            }
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 8px 12px;
-            }
-            QMenuBar::item:selected {
-                background-color: #3b3b3b;
-            }
-            QMenu {
-                background-color: #2b2b2b;
-                color: white;
-                border: 1px solid #555555;
-                padding: 5px;
-            }
-            QMenu::item {
-                padding: 8px 20px;
-            }
-            QMenu::item:selected {
-                background-color: #0078d4;
-            }
-        """)
-    
     def refresh_vaults_list(self):
         """Refresh the vaults list"""
         try:
-            self.vaults_manager.clear()
-            
             vaults = self.vault_manager.list_vaults()
             current_vault = self.vault_manager.get_current_vault_name()
             
+            rows = []
             for vault in vaults:
                 status = "🔓 OPEN" if vault.name == current_vault else "🔒 LOCKED"
                 created = vault.created_at.strftime("%Y-%m-%d") if vault.created_at else "Unknown"
                 last_accessed = vault.last_accessed.strftime("%Y-%m-%d") if vault.last_accessed else "Never"
                 
-                item = self.vaults_manager.add_item([
+                rows.append([
                     vault.name,
                     status,
                     str(vault.entry_count),
                     created,
                     last_accessed
                 ])
-                
-                # Highlight current vault
-                if vault.name == current_vault:
-                    item.setBackground(0, self.palette().highlight())
-                    self.current_vault = vault.name
+            
+            # Rows are tagged with the vault name: bulk_update may re-sort them
+            self.vaults_manager.bulk_update(rows, [vault.name for vault in vaults])
+            
+            # Highlight current vault
+            current_row = self.vaults_manager.find_item(current_vault)
+            if current_row is not None:
+                self.vaults_manager.set_item_background(current_row, self.palette().highlight())
+                self.current_vault = current_vault
             
             self.status_bar.set_status(f"Found {len(vaults)} vault(s)")
             
@@ -299,30 +274,43 @@ class MultiVaultPasswordManagerGUI(QMainWindow):
             self.status_bar.set_status(f"Error refreshing vaults: {e}")
     
     def refresh_entries(self):
-        """Refresh the entries list"""
+        """Refresh the entries list
+        
+        The entries are fetched on the thread pool and shown by
+        show_entries once they arrive.
+        """
         try:
-            self.entries_manager.clear()
-            
             if not self.current_vault:
+                self.entries_manager.clear()
                 self.current_entries = []
                 self.filtered_entries = []
+                self._haystacks = {}
+                self.event_handler.set_current_entries([])
+                return
+            
+            self.event_handler.load_entries(self.show_entries)
+            
+        except Exception as e:
+            self.status_bar.set_status(f"Error refreshing entries: {e}")
+    
+    def show_entries(self, entries):
+        """Show the entries of the current vault"""
+        try:
+            if not self.current_vault:
+                # The vault was closed while its entries were loading
                 return
             
-            entries = self.vault_manager.list_entries()
             self.current_entries = entries
-            self.filtered_entries = entries.copy()
+            self._haystacks = {entry.get("id"): self._haystack(entry) for entry in entries}
+            self.filtered_entries = [
+                entry for entry in entries if self._matches_search(entry.get("id"))
+            ]
             
-            for entry in entries:
-                # Truncate long fields for display
-                notes = entry.get("notes", "")[:50] + "..." if len(entry.get("notes", "")) > 50 else entry.get("notes", "")
-                url = entry.get("url", "")[:30] + "..." if len(entry.get("url", "")) > 30 else entry.get("url", "")
-                
-                self.entries_manager.add_item([
-                    entry.get("name", ""),
-                    entry.get("username", ""),
-                    url,
-                    notes
-                ])
+            # Rows that don't match the search are hidden by the view's filter
+            self.entries_manager.bulk_update(
+                [self._entry_row(entry) for entry in entries],
+                [entry.get("id") for entry in entries]
+            )
             
             self.event_handler.set_current_entries(entries)
             self.status_bar.set_status(f"Loaded {len(entries)} entries from '{self.current_vault}'")
@@ -333,36 +321,98 @@ class MultiVaultPasswordManagerGUI(QMainWindow):
     def filter_entries(self, search_term):
         """Filter entries based on search term"""
         try:
-            if not search_term:
-                self.filtered_entries = self.current_entries.copy()
-            else:
-                search_lower = search_term.lower()
-                self.filtered_entries = [
-                    entry for entry in self.current_entries
-                    if (search_lower in entry.get("name", "").lower() or
-                        search_lower in entry.get("username", "").lower() or
-                        search_lower in entry.get("url", "").lower() or
-                        search_lower in entry.get("notes", "").lower())
-                ]
+            self._search_lower = search_term.lower() if search_term else ""
+            self.filtered_entries = [
+                entry for entry in self.current_entries
+                if self._matches_search(entry.get("id"))
+            ]
             
-            # Update display
-            self.entries_manager.clear()
-            for entry in self.filtered_entries:
-                notes = entry.get("notes", "")[:50] + "..." if len(entry.get("notes", "")) > 50 else entry.get("notes", "")
-                url = entry.get("url", "")[:30] + "..." if len(entry.get("url", "")) > 30 else entry.get("url", "")
-                
-                self.entries_manager.add_item([
-                    entry.get("name", ""),
-                    entry.get("username", ""),
-                    url,
-                    notes
-                ])
+            # Rows stay in the model; the view only hides the non-matching ones
+            self.entries_manager.set_filter(
+                self._matches_search if self._search_lower else None
+            )
             
             self.status_bar.set_status(f"Showing {len(self.filtered_entries)} of {len(self.current_entries)} entries")
             
         except Exception as e:
             self.status_bar.set_status(f"Error filtering entries: {e}")
     
+    @staticmethod
+    def _entry_row(entry):
+        """Display values for an entry, with long fields truncated
+        
+        Built once per entry when it is shown or changed; filtering only
+        hides rows and never rebuilds them.
+        """
+        get = entry.get
+        return [
+            get("name", ""),
+            get("username", ""),
+            _truncate(get("url", ""), 30),
+            _truncate(get("notes", ""), 50),
+        ]
+    
+    @staticmethod
+    def _haystack(entry):
+        """Searchable fields of an entry, lowercased and joined once
+        
+        The unit separator keeps a term from matching across two fields.
+        """
+        return "\x1f".join((
+            entry.get("name", ""),
+            entry.get("username", ""),
+            entry.get("url", ""),
+            entry.get("notes", ""),
+        )).lower()
+    
+    def _matches_search(self, entry_id):
+        """Whether the entry with this id matches the current search term"""
+        return self._search_lower in self._haystacks.get(entry_id, "")
+    
+    def apply_entry_delta(self, kind, entry_data):
+        """Apply one added, updated or deleted entry to the list
+        
+        Only the affected row is inserted, changed or removed; the rest of
+        the list and the vault are left alone. kind is "add", "update" or
+        "delete". For "delete", entry_data only needs an "id".
+        """
+        try:
+            entry_id = entry_data.get("id")
+            row = self.entries_manager.find_item(entry_id)
+            
+            # The haystack is updated first so the view's filter sees the
+            # new fields when the row is inserted or changed
+            if kind == "add":
+                self._haystacks[entry_id] = self._haystack(entry_data)
+                self.current_entries.append(entry_data)
+                self.entries_manager.add_item(self._entry_row(entry_data), tags=entry_id)
+            elif kind == "update":
+                self._haystacks[entry_id] = self._haystack(entry_data)
+                self.current_entries = [
+                    entry_data if entry.get("id") == entry_id else entry
+                    for entry in self.current_entries
+                ]
+                if row is not None:
+                    self.entries_manager.update_item(row, self._entry_row(entry_data))
+            elif kind == "delete":
+                self._haystacks.pop(entry_id, None)
+                self.current_entries = [e for e in self.current_entries if e.get("id") != entry_id]
+                if row is not None:
+                    self.entries_manager.remove_item(row)
+            else:
+                raise ValueError(f"Unknown entry change: {kind}")
+            
+            self.filtered_entries = [
+                entry for entry in self.current_entries
+                if self._matches_search(entry.get("id"))
+            ]
+            
+            self.event_handler.set_current_entries(self.current_entries)
+            
+        except Exception as e:
+            self.status_bar.set_status(f"Error updating entries: {e}")
+    
+    @Slot()
     def show_about(self):
         """Show about dialog"""
         QMessageBox.about(
@@ -375,37 +425,39 @@ class MultiVaultPasswordManagerGUI(QMainWindow):
         )
     
     # Event handler callbacks
+    @Slot(str, str, str)
     def on_vault_created(self, name, password, description):
         """Handle vault creation"""
         self.refresh_vaults_list()
     
+    @Slot(str)
     def on_vault_opened(self, vault_name):
         """Handle vault opening"""
         self.current_vault = vault_name
         self.refresh_vaults_list()
     
+    @Slot()
     def on_vault_closed(self):
         """Handle vault closing"""
         self.current_vault = None
         self.refresh_vaults_list()
     
+    @Slot(dict)
     def on_entry_added(self, entry_data):
         """Handle entry addition"""
-        self.refresh_entries()
+        self.apply_entry_delta("add", entry_data)
     
+    @Slot(dict)
     def on_entry_updated(self, entry_data):
         """Handle entry update"""
-        self.refresh_entries()
+        self.apply_entry_delta("update", entry_data)
     
+    @Slot(int)
     def on_entry_deleted(self, entry_id):
         """Handle entry deletion"""
-        self.refresh_entries()
-    
-    def on_password_copied(self, password):
-        """Handle password copy"""
-        # Password is already copied to clipboard by the event handler
-        pass
+        self.apply_entry_delta("delete", {"id": entry_id})
     
+    @Slot(str)
     def on_status_updated(self, message):
         """Handle status updates"""
         self.status_bar.set_status(message)
@@ -435,9 +487,15 @@ def main():
     app.setApplicationVersion("1.0.0")
     app.setOrganizationName("Password Manager Team")
     
+    # Apply the shared stylesheet once for every window and dialog
+    load_stylesheet(app)
+    
     # Create and show main window
     window = MultiVaultPasswordManagerGUI()
     window.show()
     
+    # Build the dialogs once the event loop is idle instead of on first click
+    QTimer.singleShot(0, window.event_handler.prebuild_dialogs)
+    
     # Start the application
     sys.exit(app.exec()) 
\ No newline at end of file
@@ -11,7 +11,7 @@ def test_imports():
     """Test that all modular components can be imported"""
     try:
         from .main_app import MultiVaultPasswordManagerGUI
-        from .dialogs import CreateVaultDialog, AddEntryDialog, EditEntryDialog, GeneratePasswordDialog
+        from .dialogs import CreateVaultDialog, EntryDialog, GeneratePasswordDialog
         from .components import SearchBox, StatusBar, ToolBar, TreeViewManager, DialogBase
         from .events import EventHandler
         print("✅ All modular components imported successfully")
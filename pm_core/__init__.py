@@ -24,6 +24,7 @@ from .crypto import (
     apply_salt,
     apply_hash_argon2,
     derive_key,
+    clear_key_cache,
     encrypt_data,
     decrypt_data,
 )
@@ -59,6 +60,7 @@ __all__ = [
     "apply_salt",
     "apply_hash_argon2",
     "derive_key",
+    "clear_key_cache",
     "encrypt_data",
     "decrypt_data",
     "generate_password",
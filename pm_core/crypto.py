@@ -1,8 +1,13 @@
 import os
 import base64
+import hashlib
+import threading
+from collections import OrderedDict
+from argon2 import PasswordHasher
 from argon2.low_level import hash_secret_raw, Type
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from .exceptions import CryptoError
+from .utils import wipe_memory
 
 """
 Everything related to encryption, 
@@ -20,19 +25,29 @@ def apply_salt(input_string):
     return f"{salt}:{input_string}"
 
 
+# Holds only its parameters, so one instance serves every call and thread
+_password_hasher = PasswordHasher()
+
+# Argon2id parameters for derive_key
+_ARGON2_TIME_COST = 2
+_ARGON2_MEMORY_COST = 65536
+_ARGON2_PARALLELISM = 1
+
+
 def apply_hash_argon2(input_string):
-    from argon2 import PasswordHasher
+    return _password_hasher.hash(input_string)
 
-    ph = PasswordHasher()
-    return ph.hash(input_string)
 
+# (derived key, AESGCM cipher) per (password, salt), most recently used
+# last. Argon2id takes hundreds of milliseconds, and an open vault derives
+# the same key for every save and load. Entries are keyed by _cache_id,
+# never the password itself, and their keys are wiped when dropped.
+_KEY_CACHE_SIZE = 8
+_key_cache = OrderedDict()
+_key_cache_lock = threading.Lock()
 
-def derive_key(master_password: str, salt: str) -> bytes:
-    """
-    Derive a cryptographic key from master password and salt using Argon2id.
-    Returns 32 bytes suitable for AES-256 encryption.
-    """
-    # Use Argon2id to derive a key from password + salt (deterministic)
+
+def _normalize_kdf_input(master_password: str, salt: str):
     password_bytes = master_password.encode("utf-8")
     if len(salt) == 32:
         salt_bytes = bytes.fromhex(salt)
@@ -40,16 +55,81 @@ def derive_key(master_password: str, salt: str) -> bytes:
         salt_bytes = salt.encode("utf-8")
     if len(salt_bytes) < 8:
         raise ValueError("Salt must be at least 8 bytes for Argon2id")
+    return password_bytes, salt_bytes
+
+
+def _cache_id(password_bytes: bytes, salt_bytes: bytes):
+    """Cache key for a password and salt that doesn't contain the password"""
+    digest = hashlib.blake2b(password_bytes, key=salt_bytes[:64]).digest()
+    return digest, salt_bytes
+
+
+def _drop(entry):
+    """Wipe the key of an entry removed from _key_cache"""
+    wipe_memory(entry[0])
+
+
+def derive_key(master_password: str, salt: str) -> bytes:
+    """
+    Derive a cryptographic key from master password and salt using Argon2id.
+    Returns 32 bytes suitable for AES-256 encryption.
+    Keys are cached until clear_key_cache() is called.
+    """
+    return _derive(master_password, salt)[0]
+
+
+def _cipher(master_password: str, salt: str) -> AESGCM:
+    """AES-GCM cipher for the derived key, built once per cached key"""
+    return _derive(master_password, salt)[1]
+
+
+def _derive(master_password: str, salt: str):
+    password_bytes, salt_bytes = _normalize_kdf_input(master_password, salt)
+    cache_key = _cache_id(password_bytes, salt_bytes)
+    with _key_cache_lock:
+        entry = _key_cache.get(cache_key)
+        if entry is not None:
+            _key_cache.move_to_end(cache_key)
+            # Copied under the lock: the cached key may be wiped after
+            return bytes(entry[0]), entry[1]
+
+    # Use Argon2id to derive a key from password + salt (deterministic)
     key = hash_secret_raw(
         secret=password_bytes,
         salt=salt_bytes,
-        time_cost=2,
-        memory_cost=65536,
-        parallelism=1,
+        time_cost=_ARGON2_TIME_COST,
+        memory_cost=_ARGON2_MEMORY_COST,
+        parallelism=_ARGON2_PARALLELISM,
         hash_len=32,
         type=Type.ID,
     )
-    return key
+    cipher = AESGCM(key)
+    with _key_cache_lock:
+        # Another thread may have derived the same key meanwhile
+        old = _key_cache.pop(cache_key, None)
+        if old is not None:
+            _drop(old)
+        # A bytearray, so the cached copy can be wiped in place
+        _key_cache[cache_key] = (bytearray(key), cipher)
+        if len(_key_cache) > _KEY_CACHE_SIZE:
+            _drop(_key_cache.popitem(last=False)[1])
+    return key, cipher
+
+
+def clear_key_cache(master_password: str = None, salt: str = None):
+    """
+    Forget and wipe cached derived keys.
+    With a password and salt only that key is dropped, otherwise all of them.
+    """
+    with _key_cache_lock:
+        if master_password is None or salt is None:
+            for entry in _key_cache.values():
+                _drop(entry)
+            _key_cache.clear()
+        else:
+            entry = _key_cache.pop(_cache_id(*_normalize_kdf_input(master_password, salt)), None)
+            if entry is not None:
+                _drop(entry)
 
 
 def encrypt_data(data, master_password: str, salt: str):
@@ -64,9 +144,8 @@ def encrypt_data(data, master_password: str, salt: str):
         if isinstance(data, str):
             data = data.encode("utf-8")
 
-        # Derive key using Argon2id
-        derived_key = derive_key(master_password, salt)
-        aesgcm = AESGCM(derived_key)
+        # Cipher for the Argon2id-derived key
+        aesgcm = _cipher(master_password, salt)
         nonce = os.urandom(12)
         ct = aesgcm.encrypt(nonce, data, None)
         # Store nonce + ciphertext, base64-encoded
@@ -85,13 +164,17 @@ def decrypt_data(data, master_password: str, salt: str):
     Returns: plaintext (str)
     """
     try:
-        # Derive key using Argon2id
-        derived_key = derive_key(master_password, salt)
-        aesgcm = AESGCM(derived_key)
+        # Cipher for the Argon2id-derived key
+        aesgcm = _cipher(master_password, salt)
         raw = base64.b64decode(data)
         nonce = raw[:12]
         ct = raw[12:]
         pt = aesgcm.decrypt(nonce, ct, None)
         return pt.decode("utf-8")
     except Exception as e:
+        # Most likely a wrong password; don't keep its key around
+        try:
+            clear_key_cache(master_password, salt)
+        except Exception:
+            pass
         raise CryptoError(f"Decryption failed: {str(e)}")
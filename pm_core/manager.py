@@ -9,6 +9,7 @@ from datetime import datetime
 from dataclasses import asdict
 
 from .crypto import (
+    clear_key_cache,
     derive_key,
     encrypt_data,
     decrypt_data,
@@ -85,6 +86,8 @@ class PasswordManager:
             self.key = None
             self.vault = None
             self.is_unlocked = False
+        # Derived keys stay cached while a vault is open; drop them all on lock
+        clear_key_cache()
 
     def save_vault(self, master_password: str = None):
         """Save the current vault state to disk."""
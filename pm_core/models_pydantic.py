@@ -9,6 +9,7 @@ from typing import Optional, List
 from pydantic import BaseModel, Field, field_validator
 import secrets
 import string
+from .utils import random_chars
 
 
 class Entry(BaseModel):
@@ -230,13 +231,10 @@ def generate_password_from_config(config: PasswordGenerationConfig) -> str:
     if not all_chars:
         raise ValueError("At least one character set must be enabled")
     
-    # Generate password
-    password = "".join(secrets.choice(all_chars) for _ in range(config.length))
-    
-    # Ensure password meets requirements
+    # Generate password, regenerating if it misses a required character set
     max_attempts = 10
     for attempt in range(max_attempts):
-        password = "".join(secrets.choice(all_chars) for _ in range(config.length))
+        password = random_chars(all_chars, config.length)
         
         # Check if password meets all requirements
         meets_requirements = True
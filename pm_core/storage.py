@@ -1,7 +1,7 @@
 import sqlite3
 import json
 import os
-from typing import Any, List, Tuple, Optional
+from typing import Any, Dict, Iterable, List, Tuple, Optional
 from .exceptions import StorageError
 
 
@@ -9,10 +9,18 @@ class SQLiteStorage:
     def __init__(self, db_path: str = "pm_data.db"):
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path)
+        # One cursor for every statement; sqlite3 caches the prepared
+        # statements per connection
+        self._cur = self.conn.cursor()
         self._init_db()
 
     def _init_db(self):
-        cursor = self.conn.cursor()
+        cursor = self._cur
+        # Keep the rollback journal: a vault must stay a single file, as
+        # VaultManager deletes, renames and copies it with plain file
+        # operations. This also turns back files saved in WAL mode.
+        cursor.execute("PRAGMA journal_mode=DELETE")
+        cursor.execute("PRAGMA temp_store=MEMORY")
         # Create tables for vault data
         cursor.execute(
             """
@@ -28,8 +36,7 @@ class SQLiteStorage:
         self.conn.commit()
 
     def set(self, key: str, value: str) -> None:
-        cursor = self.conn.cursor()
-        cursor.execute(
+        self._cur.execute(
             """
             INSERT INTO vault_data (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)
             ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=CURRENT_TIMESTAMP
@@ -38,21 +45,40 @@ class SQLiteStorage:
         )
         self.conn.commit()
 
+    def set_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        """Insert or update several (key, value) pairs in one transaction."""
+        with self.conn:
+            self._cur.executemany(
+                """
+                INSERT INTO vault_data (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=CURRENT_TIMESTAMP
+            """,
+                items,
+            )
+
     def get(self, key: str) -> Optional[str]:
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT value FROM vault_data WHERE key = ?", (key,))
-        row = cursor.fetchone()
+        self._cur.execute("SELECT value FROM vault_data WHERE key = ?", (key,))
+        row = self._cur.fetchone()
         return row[0] if row else None
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Fetch several keys in one query; missing keys are left out."""
+        keys = list(keys)
+        if not keys:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        self._cur.execute(
+            f"SELECT key, value FROM vault_data WHERE key IN ({placeholders})", keys
+        )
+        return dict(self._cur.fetchall())
+
     def delete(self, key: str) -> None:
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM vault_data WHERE key = ?", (key,))
+        self._cur.execute("DELETE FROM vault_data WHERE key = ?", (key,))
         self.conn.commit()
 
     def list_keys(self) -> List[str]:
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT key FROM vault_data")
-        return [row[0] for row in cursor.fetchall()]
+        self._cur.execute("SELECT key FROM vault_data")
+        return [row[0] for row in self._cur.fetchall()]
 
     def close(self):
         self.conn.close()
@@ -63,8 +89,7 @@ def save_vault_file(vault_data: str, salt: str, vault_path: str):
     storage = None
     try:
         storage = SQLiteStorage(vault_path)
-        storage.set("vault_data", vault_data)
-        storage.set("salt", salt)
+        storage.set_many([("vault_data", vault_data), ("salt", salt)])
     except Exception as e:
         raise StorageError(f"Failed to save vault: {str(e)}")
     finally:
@@ -80,10 +105,9 @@ def load_vault_file(vault_path: str) -> tuple:
             return None, None
 
         storage = SQLiteStorage(vault_path)
-        vault_data = storage.get("vault_data")
-        salt = storage.get("salt")
+        values = storage.get_many(["vault_data", "salt"])
 
-        return vault_data, salt
+        return values.get("vault_data"), values.get("salt")
     except Exception as e:
         raise StorageError(f"Failed to load vault: {str(e)}")
     finally:
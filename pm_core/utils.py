@@ -5,6 +5,35 @@ import sys
 from typing import Optional
 
 
+def random_chars(alphabet: str, length: int) -> str:
+    """
+    Draw characters uniformly at random from an alphabet.
+
+    Entropy is read in bulk with one secrets.token_bytes() call per round
+    rather than one secrets.choice() call per character. Bytes that would
+    bias the modulo are rejected.
+
+    Args:
+        alphabet: Characters to choose from (at most 256)
+        length: Number of characters to return
+
+    Returns:
+        Random string of the given length ("" if length <= 0)
+    """
+    size = len(alphabet)
+    if not 0 < size <= 256:
+        raise ValueError("Alphabet must contain between 1 and 256 characters")
+
+    # Bytes at or above this limit would make the first characters likelier
+    limit = 256 - 256 % size
+    chars = []
+    while len(chars) < length:
+        # Ask for twice what's missing so one round almost always suffices
+        raw = secrets.token_bytes(2 * (length - len(chars)))
+        chars.extend([alphabet[b % size] for b in raw if b < limit])
+    return "".join(chars[:length])
+
+
 def generate_password(
     length: int = 16,
     include_symbols: bool = True,
@@ -39,13 +68,10 @@ def generate_password(
     if not all_chars:
         raise ValueError("At least one character set must be enabled")
 
-    # Generate password
-    password = "".join(secrets.choice(all_chars) for _ in range(length))
-
-    # Ensure password meets minimum requirements by regenerating if needed
+    # Generate password, regenerating if it misses a required character set
     max_attempts = 10
     for attempt in range(max_attempts):
-        password = "".join(secrets.choice(all_chars) for _ in range(length))
+        password = random_chars(all_chars, length)
 
         # Check if password meets all requirements
         meets_requirements = True
@@ -138,7 +164,7 @@ def wipe_memory(data) -> None:
     Securely wipe data from memory.
 
     Args:
-        data: Data to wipe (string, bytes, or list)
+        data: Data to wipe (string, bytes, bytearray, or list)
     """
     if isinstance(data, str):
         # Overwrite string with random data
@@ -154,6 +180,9 @@ def wipe_memory(data) -> None:
         # For bytes objects, we can't modify them directly as they're immutable
         # The best we can do is help with garbage collection
         del data
+    elif isinstance(data, bytearray):
+        # Mutable, so it can be overwritten in place
+        data[:] = bytes(len(data))
     elif isinstance(data, list):
         # Recursively wipe list contents
         for item in data:
@@ -38,6 +38,7 @@ setup(
     url="",
     packages=find_packages(),
     include_package_data=True,
+    package_data={"gui": ["style.qss"]},
     install_requires=read_requirements(),
     entry_points={
         "console_scripts": [
@@ -57,3 +57,60 @@ def test_decrypt_data_bad_key():
     enc = crypto.encrypt_data(data, pw, salt)
     with pytest.raises(CryptoError):
         crypto.decrypt_data(enc, "wrongpw", salt)
+
+
+@pytest.fixture
+def kdf_calls(monkeypatch):
+    """Count Argon2id derivations"""
+    calls = []
+    real = crypto.hash_secret_raw
+
+    def counting(**kwargs):
+        calls.append(kwargs["secret"])
+        return real(**kwargs)
+
+    monkeypatch.setattr(crypto, "hash_secret_raw", counting)
+    crypto.clear_key_cache()
+    return calls
+
+
+def test_derive_key_cached(kdf_calls):
+    salt = crypto.generate_salt()
+    k1 = crypto.derive_key("pw", salt)
+    k2 = crypto.derive_key("pw", salt)
+    assert k1 == k2
+    assert len(kdf_calls) == 1
+    assert crypto.derive_key("other", salt) != k1
+
+
+def test_clear_key_cache(kdf_calls):
+    salt = crypto.generate_salt()
+    k1 = crypto.derive_key("pw", salt)
+    cached = [entry[0] for entry in crypto._key_cache.values()]
+    crypto.clear_key_cache()
+    assert all(not any(key) for key in cached)
+    k2 = crypto.derive_key("pw", salt)
+    assert k1 == k2
+    assert len(kdf_calls) == 2
+
+
+def test_key_cache_does_not_hold_password(kdf_calls):
+    salt = crypto.generate_salt()
+    crypto.derive_key("cachedpassword", salt)
+    for digest, salt_bytes in crypto._key_cache:
+        assert b"cachedpassword" not in digest + salt_bytes
+
+
+def test_decrypt_data_bad_key_not_cached(kdf_calls):
+    salt = crypto.generate_salt()
+    enc = crypto.encrypt_data("secret data", "masterpw", salt)
+    crypto.derive_key("wrongpw", salt)
+    with pytest.raises(CryptoError):
+        crypto.decrypt_data(enc, "wrongpw", salt)
+    crypto.derive_key("wrongpw", salt)
+    assert kdf_calls.count(b"wrongpw") == 2
+
+
+def test_cipher_reused_for_cached_key():
+    salt = crypto.generate_salt()
+    assert crypto._cipher("pw", salt) is crypto._cipher("pw", salt)
@@ -30,6 +30,31 @@ def test_sqlite_storage_set_get_delete_list(db_path):
     s.close()
 
 
+def test_sqlite_storage_set_many(db_path):
+    s = storage.SQLiteStorage(db_path)
+    s.set("foo", "old")
+    s.set_many([("foo", "bar"), ("baz", "qux")])
+    assert s.get("foo") == "bar"
+    assert s.get("baz") == "qux"
+    s.close()
+
+
+def test_sqlite_storage_get_many(db_path):
+    s = storage.SQLiteStorage(db_path)
+    s.set_many([("foo", "bar"), ("baz", "qux")])
+    assert s.get_many(["foo", "baz", "missing"]) == {"foo": "bar", "baz": "qux"}
+    assert s.get_many([]) == {}
+    s.close()
+
+
+def test_vault_file_has_no_sidecar_files(db_path):
+    storage.save_vault_file("vaultdata", "saltdata", db_path)
+    s = storage.SQLiteStorage(db_path)
+    s.set("foo", "bar")
+    assert os.listdir(os.path.dirname(db_path)) == ["test.db"]
+    s.close()
+
+
 def test_save_load_vault_file(db_path):
     storage.save_vault_file("vaultdata", "saltdata", db_path)
     vault, salt = storage.load_vault_file(db_path)
@@ -10,6 +10,7 @@ import string
 from unittest.mock import patch, Mock
 from pm_core.utils import (
     generate_password,
+    random_chars,
     validate_password_strength,
     get_system_info,
     wipe_memory,
@@ -80,6 +81,31 @@ class TestPasswordGeneration:
             assert password not in passwords
             passwords.add(password)
 
+    @pytest.mark.unit
+    def test_random_chars(self):
+        """Test bulk random character drawing"""
+        alphabet = string.ascii_letters + string.digits
+        chars = random_chars(alphabet, 500)
+        assert len(chars) == 500
+        assert set(chars) <= set(alphabet)
+        assert random_chars(alphabet, 0) == ""
+        assert random_chars("x", 8) == "xxxxxxxx"
+
+    @pytest.mark.unit
+    def test_random_chars_invalid_alphabet(self):
+        """Test random_chars with an empty or oversized alphabet"""
+        with pytest.raises(ValueError):
+            random_chars("", 8)
+        with pytest.raises(ValueError):
+            random_chars("a" * 257, 8)
+
+    @pytest.mark.security
+    def test_random_chars_covers_alphabet(self):
+        """Test that rejection sampling still reaches every character"""
+        # 200 symbols don't divide 256, so biased bytes must be rejected
+        alphabet = "".join(chr(0x100 + i) for i in range(200))
+        assert set(random_chars(alphabet, 20000)) == set(alphabet)
+
 
 class TestPasswordValidation:
     """Test password strength validation"""
@@ -162,6 +188,14 @@ class TestMemoryWiping:
         # The bytes object should still exist
         assert test_bytes is not None
 
+    @pytest.mark.security
+    def test_wipe_memory_bytearray(self):
+        """Test wiping a bytearray in place"""
+        test_buf = bytearray(b"sensitive_data_456")
+        wipe_memory(test_buf)
+
+        assert test_buf == bytearray(len(b"sensitive_data_456"))
+
     @pytest.mark.security
     def test_wipe_memory_list(self):
         """Test wiping list from memory"""